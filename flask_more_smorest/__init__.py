@@ -67,9 +67,9 @@ from .perms.user_models import (
     User,
     UserRole,
     UserSetting,
+    get_current_user,
     get_current_user_id,
 )
-from .perms.user_models import current_user as get_current_user
 
 # Import migration system
 # Import database and models
@@ -6,12 +6,14 @@ with Marshmallow schemas.
 """
 
 import enum
+import sys
 import uuid
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
+from functools import cache
 from http import HTTPStatus
 from importlib import import_module
-from typing import TYPE_CHECKING, Any, TypedDict
+from typing import TYPE_CHECKING, Any, Final, TypedDict
 
 import sqlalchemy as sa
 from flask.views import MethodView
@@ -31,6 +33,82 @@ if TYPE_CHECKING:
     from flask_smorest.pagination import PaginationParameters
 
 
+# Status codes used by the generated CRUD views, bound once for the view factories
+_OK: Final = HTTPStatus.OK
+_NO_CONTENT: Final = HTTPStatus.NO_CONTENT
+_NOT_FOUND: Final = HTTPStatus.NOT_FOUND
+_CONFLICT: Final = HTTPStatus.CONFLICT
+
+
+@cache
+def _cached_import(module_path: str, attr_name: str) -> Any:
+    """Import ``attr_name`` from ``module_path``, memoizing successful lookups.
+
+    Blueprints commonly resolve several names from the same ``models`` and
+    ``schemas`` modules, so the result is cached per (module, attribute) pair.
+    Failed lookups raise and are not cached.
+
+    Raises:
+        ImportError: If the module cannot be imported
+        AttributeError: If the module has no such attribute
+    """
+    module = sys.modules.get(module_path) or import_module(module_path)
+    return getattr(module, attr_name)
+
+
+# Werkzeug URL converter for each SQLAlchemy column type, matched along the type's MRO so
+# subclasses (``BigInteger``, dialect ``UUID`` ...) resolve to their generic parent's entry.
+# ``CHAR`` maps to ``uuid`` because it is the storage type ``Uuid`` emulates on most dialects.
+_SQLA_TYPE_URL_CONVERTERS: dict[type[sa.types.TypeEngine[Any]], str] = {
+    sa.Uuid: "uuid",
+    sa.CHAR: "uuid",
+    sa.Integer: "int",
+    sa.Float: "float",
+    sa.String: "string",
+}
+
+
+@cache
+def _url_converter_for_type(type_cls: type) -> str:
+    """Return the URL converter name for a SQLAlchemy column type class.
+
+    Falls back to ``string`` for types without a dedicated converter.
+    """
+    for klass in type_cls.__mro__:
+        converter = _SQLA_TYPE_URL_CONVERTERS.get(klass)
+        if converter is not None:
+            return converter
+    return "string"
+
+
+def _url_converter_for_column(column_type: sa.types.TypeEngine[Any]) -> str:
+    """Return the URL converter name for a column type instance, unwrapping ``TypeDecorator``s."""
+    while isinstance(column_type, sa.types.TypeDecorator):
+        column_type = column_type.impl_instance
+    type_cls: type = type(column_type)
+    return _url_converter_for_type(type_cls)
+
+
+_PARTIAL_SCHEMA_ATTR = "_flask_more_smorest_partial_instance"
+
+
+def _partial_schema_instance(schema_cls: type[Schema]) -> Schema:
+    """Return a shared ``partial=True`` instance of ``schema_cls`` for PATCH payloads.
+
+    The instance is cached on the schema class itself (looked up in its own ``__dict__``
+    so subclasses don't pick up their parent's instance), which saves re-compiling the
+    schema fields every time a blueprint is built for it.
+    """
+    cached: Schema | None = vars(schema_cls).get(_PARTIAL_SCHEMA_ATTR)
+    if cached is None:
+        # NOTE: the following will trigger a warning in apispec if no custom resolver is set
+        cached = schema_cls(partial=True)
+        if isinstance(cached, SQLAlchemySchema):
+            cached._load_instance = False
+        setattr(schema_cls, _PARTIAL_SCHEMA_ATTR, cached)
+    return cached
+
+
 class CRUDMethod(enum.StrEnum):
     """Standard CRUD operations supported by CRUDBlueprint."""
 
@@ -41,6 +119,16 @@ class CRUDMethod(enum.StrEnum):
     DELETE = "DELETE"
 
 
+@cache
+def _whitelisted_methods(items: tuple[CRUDMethod | str, ...]) -> tuple[CRUDMethod, ...]:
+    """Coerce a ``methods`` whitelist to unique ``CRUDMethod`` members, in order.
+
+    Many blueprints share the same method list, so the coercion is memoized.
+    Invalid names raise ``ValueError`` and are not cached.
+    """
+    return tuple(dict.fromkeys(CRUDMethod(item) for item in items))
+
+
 class MethodConfig(TypedDict, total=False):
     """Configuration for a specific CRUD method."""
 
@@ -52,7 +140,7 @@ class MethodConfig(TypedDict, total=False):
 MethodConfigMapping = Mapping[CRUDMethod, MethodConfig | bool]
 
 
-@dataclass
+@dataclass(slots=True)
 class CRUDConfig:
     """Configuration object for CRUD blueprint setup."""
 
@@ -235,14 +323,17 @@ class CRUDBlueprint(CRUDPaginationMixin, Blueprint):
 
         resolved_url_prefix: str = url_prefix or f"/{name}/"
 
-        resolved_model_import_path: str = model_import_name or ".".join(import_name.split(".")[:-1] + ["models"])
-        resolved_schema_import_path: str = schema_import_name or ".".join(import_name.split(".")[:-1] + ["schemas"])
+        # Default to the ``models``/``schemas`` modules next to the blueprint's module
+        parent_package = import_name.rpartition(".")[0]
+        package_prefix = f"{parent_package}." if parent_package else ""
+        resolved_model_import_path: str = model_import_name or f"{package_prefix}models"
+        resolved_schema_import_path: str = schema_import_name or f"{package_prefix}schemas"
 
         model_or_name = model or convert_snake_to_camel(name.capitalize())
         model_cls: type[BaseModel]
         if isinstance(model_or_name, str):
             try:
-                model_cls = getattr(import_module(resolved_model_import_path), model_or_name)
+                model_cls = _cached_import(resolved_model_import_path, model_or_name)
             except (ImportError, AttributeError) as e:
                 raise ValueError(
                     f"Could not import model '{model_or_name}' from '{resolved_model_import_path}'."
@@ -260,8 +351,7 @@ class CRUDBlueprint(CRUDPaginationMixin, Blueprint):
 
         if isinstance(schema_or_name, str):
             try:
-                schema_module = import_module(resolved_schema_import_path)
-                schema_cls = getattr(schema_module, schema_or_name)
+                schema_cls = _cached_import(resolved_schema_import_path, schema_or_name)
             except (ImportError, AttributeError) as e:
                 raise ValueError(
                     f"Could not import schema '{schema_or_name}' from '{resolved_schema_import_path}'."
@@ -280,20 +370,24 @@ class CRUDBlueprint(CRUDPaginationMixin, Blueprint):
         # This happens after normalization so it works consistently regardless
         # of whether methods was a list or dict
         if skip_methods:
-            for method_to_skip in skip_methods:
-                method_enum = CRUDMethod(method_to_skip)
-                normalized_methods.pop(method_enum, None)
-
-                # Warn if dict already disabled this method (redundant)
-                if isinstance(methods, dict) and methods.get(method_enum) is False:
-                    import warnings
-
-                    warnings.warn(
-                        f"Method {method_enum.value} is set to False in 'methods' dict "
-                        f"and also appears in 'skip_methods'. The skip_methods entry is redundant.",
-                        UserWarning,
-                        stacklevel=3,
-                    )
+            skip_set = frozenset(CRUDMethod(method_to_skip) for method_to_skip in skip_methods)
+            normalized_methods = {
+                method: method_config for method, method_config in normalized_methods.items() if method not in skip_set
+            }
+
+            # Warn if dict already disabled this method (redundant)
+            if isinstance(methods, dict):
+                for method_to_skip in skip_methods:
+                    method_enum = CRUDMethod(method_to_skip)
+                    if methods.get(method_enum) is False:
+                        import warnings
+
+                        warnings.warn(
+                            f"Method {method_enum.value} is set to False in 'methods' dict "
+                            f"and also appears in 'skip_methods'. The skip_methods entry is redundant.",
+                            UserWarning,
+                            stacklevel=3,
+                        )
 
         return CRUDConfig(
             name=name,
@@ -333,14 +427,12 @@ class CRUDBlueprint(CRUDPaginationMixin, Blueprint):
             TypeError: If methods_raw is not a list or dict, or if dict values
                       are invalid
         """
-        normalized: dict[CRUDMethod, MethodConfig] = {}
-
         if isinstance(methods_raw, list):
-            # List mode: explicit whitelist - only these methods are enabled
-            for item in methods_raw:
-                key = CRUDMethod(item)
-                normalized[key] = {}
-            return normalized
+            # List mode: explicit whitelist - only these methods are enabled.
+            # Fresh config dicts on every call, as callers may mutate them.
+            return {key: {} for key in _whitelisted_methods(tuple(methods_raw))}
+
+        normalized: dict[CRUDMethod, MethodConfig] = {}
 
         if not isinstance(methods_raw, Mapping):
             raise TypeError(
@@ -383,8 +475,7 @@ class CRUDBlueprint(CRUDPaginationMixin, Blueprint):
 
         if isinstance(schema_candidate, str):
             try:
-                schema_module = import_module(config.schema_import_path)
-                resolved = getattr(schema_module, schema_candidate)
+                resolved = _cached_import(config.schema_import_path, schema_candidate)
             except (ImportError, AttributeError) as e:
                 raise ValueError(
                     f"Could not import schema '{schema_candidate}' from '{config.schema_import_path}'."
@@ -422,8 +513,7 @@ class CRUDBlueprint(CRUDPaginationMixin, Blueprint):
             # Explicit patch schema provided
             if isinstance(update_schema_arg, str):
                 try:
-                    schema_module = import_module(config.schema_import_path)
-                    update_schema = getattr(schema_module, update_schema_arg)
+                    update_schema = _cached_import(config.schema_import_path, update_schema_arg)
                 except (ImportError, AttributeError) as e:
                     raise ValueError(
                         f"Could not import schema '{update_schema_arg}' from '{config.schema_import_path}'."
@@ -433,10 +523,7 @@ class CRUDBlueprint(CRUDPaginationMixin, Blueprint):
             else:
                 raise TypeError("PATCH 'arg_schema' must be a string or Schema class/instance.")
         else:
-            # NOTE: the following will trigger a warning in apispec if no custom resolver is set
-            update_schema = config.schema_cls(partial=True)
-            if isinstance(update_schema, SQLAlchemySchema):
-                update_schema._load_instance = False
+            update_schema = _partial_schema_instance(config.schema_cls)
 
         return update_schema
 
@@ -451,168 +538,70 @@ class CRUDBlueprint(CRUDPaginationMixin, Blueprint):
             config: Configuration object
             update_schema: Update schema for PATCH operations
         """
-        id_type = str(getattr(config.model_cls, config.res_id_name).type).lower()
-        if id_type.startswith("char"):
-            id_type = "uuid"
-        model_cls: type[BaseModel] = config.model_cls
+        id_column = getattr(config.model_cls, config.res_id_name, None)
+        if id_column is None:
+            raise ValueError(
+                f"CRUDBlueprint model '{config.model_name}' has no '{config.res_id_name}' resource id field."
+            )
+        id_type = _url_converter_for_column(id_column.type)
         schema_cls: type[Schema] = config.schema_cls
+        methods = config.methods
+
+        if "PUT" in methods:
+            raise NotImplementedError("PUT method is not implemented. Use PATCH instead.")
+
+        # Views are built first and registered together at the end, so a configuration
+        # error in either one leaves the blueprint without any half-registered routes.
+        pending_routes: list[tuple[str, type[MethodView]]] = []
 
-        if CRUDMethod.INDEX in config.methods or CRUDMethod.POST in config.methods:
-            if CRUDMethod.INDEX in config.methods:
-                index_schema_candidate = config.methods[CRUDMethod.INDEX].get("schema", schema_cls)
+        if CRUDMethod.INDEX in methods or CRUDMethod.POST in methods:
+            index_schema_class: type[Schema] | None = None
+            if CRUDMethod.INDEX in methods:
+                index_schema_candidate = methods[CRUDMethod.INDEX].get("schema", schema_cls)
                 index_schema_class = self._resolve_schema_class(
                     index_schema_candidate, config=config, method=CRUDMethod.INDEX
                 )
-                query_filter_schema = generate_filter_schema(base_schema=index_schema_class)
-
-            class GenericIndex(MethodView):
-                """Index/Post endpoints."""
-
-                if CRUDMethod.INDEX in config.methods:
-
-                    @self.arguments(query_filter_schema, location="query", unknown=RAISE)
-                    @self.response(HTTPStatus.OK, index_schema_class(many=True))
-                    @self.paginate()
-                    @self.doc(operationId=f"list{config.model_name}")
-                    def get(
-                        _self,  # NOTE: using _self to avoid collision with outer self
-                        filters: dict,
-                        pagination_parameters: "PaginationParameters",
-                        **kwargs: Any,
-                    ) -> Sequence[BaseModel]:
-                        """Fetch all resources.
-                        kwargs might contains path parameters to filter by (eg /user/<uuid:user_id>/roles/)
-                        """
-
-                        stmts = get_statements_from_filters(filters, model=model_cls)
-                        base_query = sa.select(model_cls).filter_by(**kwargs).filter(*stmts)
-
-                        # Handle pagination
-                        count_query = sa.select(sa.func.count()).select_from(base_query.subquery())
-                        total_items = self._db_session.scalar(count_query)
-                        pagination_parameters.item_count = total_items  # pyright: ignore[reportAttributeAccessIssue]
-
-                        paginated_query = base_query.limit(pagination_parameters.page_size).offset(
-                            pagination_parameters.page_size * (pagination_parameters.page - 1)
-                        )
-
-                        res = self._db_session.execute(paginated_query)
-                        return res.scalars().all()
-
-                if CRUDMethod.POST in config.methods:
-
-                    @self.arguments(config.methods[CRUDMethod.POST].get("schema", schema_cls))
-                    @self.response(
-                        HTTPStatus.OK,
-                        config.methods[CRUDMethod.POST].get("schema", schema_cls),
-                    )
-                    @self.doc(
-                        responses={
-                            HTTPStatus.NOT_FOUND: {"description": f"{config.name} resource not found"},
-                            HTTPStatus.CONFLICT: {"description": "DB error."},
-                        },
-                        operationId=f"create{config.model_name}",
-                    )
-                    def post(
-                        _self,
-                        new_object: BaseModel,
-                        **kwargs: str | int | float | bool | bytes | None,
-                    ) -> BaseModel:
-                        """Create and return new resource."""
-                        new_object.update(commit=True, **kwargs)
-                        new_object.save()
-                        return new_object
 
+            index_view = _build_index_view(self, config, index_schema_class)
             self._configure_endpoint(
-                GenericIndex,
+                index_view,
                 "get",
                 f"Fetch all {config.name} resources.",
-                config.methods.get(CRUDMethod.INDEX, {}),
+                methods.get(CRUDMethod.INDEX, {}),
             )
             self._configure_endpoint(
-                GenericIndex,
+                index_view,
                 "post",
                 f"Create and return new {config.name}.",
-                config.methods.get(CRUDMethod.POST, {}),
+                methods.get(CRUDMethod.POST, {}),
             )
-            self.route("")(GenericIndex)
-
-        class GenericCRUD(MethodView):
-            """Resource-specific endpoints."""
+            pending_routes.append(("", index_view))
 
-            if CRUDMethod.GET in config.methods:
-
-                @self.doc(
-                    responses={HTTPStatus.NOT_FOUND: {"description": f"{config.name} not found"}},
-                    operationId=f"get{config.model_name}",
-                )
-                @self.response(
-                    HTTPStatus.OK,
-                    config.methods[CRUDMethod.GET].get("schema", schema_cls),
-                )
-                def get(_self, **kwargs: Any) -> BaseModel:
-                    """Fetch resource by ID."""
-                    kwargs[config.res_id_name] = kwargs.pop(config.res_id_param_name)
-                    res = model_cls.get_by_or_404(**kwargs)
-                    return res
-
-            if CRUDMethod.PATCH in config.methods:
-
-                @self.arguments(update_schema)
-                @self.doc(
-                    responses={
-                        HTTPStatus.NOT_FOUND: {"description": f"{config.name} not found"},
-                        HTTPStatus.CONFLICT: {"description": "DB error."},
-                    },
-                    operationId=f"update{config.model_name}",
-                )
-                @self.response(
-                    HTTPStatus.OK,
-                    config.methods[CRUDMethod.PATCH].get("schema", schema_cls),
-                )
-                def patch(_self, payload: dict, **kwargs: str | int | uuid.UUID | bool | None) -> BaseModel:
-                    """Update resource."""
-                    kwargs[config.res_id_name] = kwargs.pop(config.res_id_param_name)
-                    res = model_cls.get_by_or_404(**kwargs)
-                    res.update(**payload)
-                    return res
-
-            if CRUDMethod.DELETE in config.methods:
-
-                @self.response(HTTPStatus.NO_CONTENT, description=f"{config.name} deleted")
-                @self.doc(operationId=f"delete{config.model_name}")
-                def delete(_self, **kwargs: str | int | uuid.UUID | bool | None) -> tuple[str, int]:
-                    """Delete resource."""
-                    kwargs[config.res_id_name] = kwargs.pop(config.res_id_param_name)
-                    res = model_cls.get_by_or_404(**kwargs)
-                    res.delete()
-                    return "", HTTPStatus.NO_CONTENT
-
-            if "PUT" in config.methods:
-                raise NotImplementedError("PUT method is not implemented. Use PATCH instead.")
-
-        self._configure_endpoint(
-            GenericCRUD,
-            "get",
-            f"Fetch {config.name} by ID.",
-            config.methods.get(CRUDMethod.GET, {}),
-        )
-        self._configure_endpoint(
-            GenericCRUD,
-            "patch",
-            f"Update {config.name} by ID.",
-            config.methods.get(CRUDMethod.PATCH, {}),
-        )
-        self._configure_endpoint(
-            GenericCRUD,
-            "delete",
-            f"Delete {config.name} by ID.",
-            config.methods.get(CRUDMethod.DELETE, {}),
-        )
+        # Only register the resource view if it has at least one method
+        if any(method in methods for method in [CRUDMethod.GET, CRUDMethod.PATCH, CRUDMethod.DELETE]):
+            resource_view = _build_resource_view(self, config, update_schema)
+            self._configure_endpoint(
+                resource_view,
+                "get",
+                f"Fetch {config.name} by ID.",
+                methods.get(CRUDMethod.GET, {}),
+            )
+            self._configure_endpoint(
+                resource_view,
+                "patch",
+                f"Update {config.name} by ID.",
+                methods.get(CRUDMethod.PATCH, {}),
+            )
+            self._configure_endpoint(
+                resource_view,
+                "delete",
+                f"Delete {config.name} by ID.",
+                methods.get(CRUDMethod.DELETE, {}),
+            )
+            pending_routes.append((f"<{id_type}:{config.res_id_param_name}>", resource_view))
 
-        # Only register GenericCRUD if it has at least one method
-        if any(method in config.methods for method in [CRUDMethod.GET, CRUDMethod.PATCH, CRUDMethod.DELETE]):
-            self.route(f"<{id_type}:{config.res_id_param_name}>")(GenericCRUD)
+        for rule, view in pending_routes:
+            self.route(rule)(view)
 
     def _configure_endpoint(
         self,
@@ -639,3 +628,168 @@ class CRUDBlueprint(CRUDPaginationMixin, Blueprint):
                     self.admin_endpoint(method)
                 else:
                     raise TypeError("Blueprint must inherit from PermsBlueprintMixin to set admin_only endpoint.")
+
+
+def _operation_id(action: str, model_name: str) -> str:
+    """Return the interned OpenAPI operationId for ``action`` on ``model_name``.
+
+    Interning lets the operationId strings apispec stores and compares while building
+    the spec share one object per name.
+    """
+    return sys.intern(f"{action}{model_name}")
+
+
+def _build_index_view(
+    bp: CRUDBlueprint,
+    config: CRUDConfig,
+    index_schema_class: type[Schema] | None,
+) -> type[MethodView]:
+    """Build the collection view (list/create) for a CRUD blueprint.
+
+    Handlers are plain functions decorated explicitly and assembled with ``type()``,
+    so each schema instance passed to the decorators is built exactly once.
+
+    Args:
+        bp: Blueprint whose decorators document and wrap the handlers
+        config: Configuration object
+        index_schema_class: Schema for INDEX responses, or None if INDEX is disabled
+
+    Returns:
+        MethodView subclass exposing the enabled ``get``/``post`` handlers
+    """
+    model_cls = config.model_cls
+    methods = config.methods
+    attrs: dict[str, Any] = {"__doc__": "Index/Post endpoints."}
+
+    if index_schema_class is not None:
+        query_filter_schema = generate_filter_schema(base_schema=index_schema_class)
+        # The total count only feeds the pagination header, so skip it when headers are disabled
+        count_items = bp.PAGINATION_HEADER_NAME is not None
+
+        def get(
+            _self: MethodView,
+            filters: dict,
+            pagination_parameters: "PaginationParameters",
+            **kwargs: Any,
+        ) -> Sequence[BaseModel]:
+            """Fetch all resources.
+            kwargs might contains path parameters to filter by (eg /user/<uuid:user_id>/roles/)
+            """
+
+            stmts = get_statements_from_filters(filters, model=model_cls)
+            base_query = sa.select(model_cls).filter_by(**kwargs).filter(*stmts)
+
+            # Handle pagination
+            if count_items:
+                count_query = sa.select(sa.func.count()).select_from(base_query.subquery())
+                total_items = bp._db_session.scalar(count_query)
+                pagination_parameters.item_count = total_items  # pyright: ignore[reportAttributeAccessIssue]
+
+            paginated_query = base_query.limit(pagination_parameters.page_size).offset(
+                pagination_parameters.page_size * (pagination_parameters.page - 1)
+            )
+
+            res = bp._db_session.execute(paginated_query)
+            return res.scalars().all()
+
+        get = bp.doc(operationId=_operation_id("list", config.model_name))(get)
+        get = bp.paginate()(get)
+        get = bp.response(_OK, index_schema_class(many=True))(get)
+        attrs["get"] = bp.arguments(query_filter_schema, location="query", unknown=RAISE)(get)
+
+    if CRUDMethod.POST in methods:
+        post_schema = methods[CRUDMethod.POST].get("schema", config.schema_cls)
+
+        def post(
+            _self: MethodView,
+            new_object: BaseModel,
+            **kwargs: str | int | float | bool | bytes | None,
+        ) -> BaseModel:
+            """Create and return new resource."""
+            new_object.update(commit=True, **kwargs)
+            new_object.save()
+            return new_object
+
+        post = bp.doc(
+            responses={
+                _NOT_FOUND: {"description": sys.intern(f"{config.name} resource not found")},
+                _CONFLICT: {"description": "DB error."},
+            },
+            operationId=_operation_id("create", config.model_name),
+        )(post)
+        post = bp.response(_OK, post_schema)(post)
+        attrs["post"] = bp.arguments(post_schema)(post)
+
+    return type("GenericIndex", (MethodView,), attrs)
+
+
+def _build_resource_view(
+    bp: CRUDBlueprint,
+    config: CRUDConfig,
+    update_schema: Schema | type[Schema],
+) -> type[MethodView]:
+    """Build the single-resource view (get/update/delete) for a CRUD blueprint.
+
+    Args:
+        bp: Blueprint whose decorators document and wrap the handlers
+        config: Configuration object
+        update_schema: Argument schema for PATCH payloads
+
+    Returns:
+        MethodView subclass exposing the enabled ``get``/``patch``/``delete`` handlers
+    """
+    model_cls = config.model_cls
+    methods = config.methods
+    res_id_name = config.res_id_name
+    res_id_param_name = config.res_id_param_name
+    not_found_response = {_NOT_FOUND: {"description": sys.intern(f"{config.name} not found")}}
+    attrs: dict[str, Any] = {"__doc__": "Resource-specific endpoints."}
+
+    def get_resource(path_params: dict[str, Any]) -> BaseModel:
+        """Load the addressed resource, also filtering on any parent path parameters.
+
+        Nested routes (eg /user/<uuid:user_id>/roles/<uuid:role_id>) pass every
+        path parameter through, so they are all kept as filters.
+        """
+        path_params[res_id_name] = path_params.pop(res_id_param_name)
+        return model_cls.get_by_or_404(**path_params)
+
+    if CRUDMethod.GET in methods:
+
+        def get(_self: MethodView, **kwargs: Any) -> BaseModel:
+            """Fetch resource by ID."""
+            return get_resource(kwargs)
+
+        get = bp.response(_OK, methods[CRUDMethod.GET].get("schema", config.schema_cls))(get)
+        attrs["get"] = bp.doc(responses=not_found_response, operationId=_operation_id("get", config.model_name))(get)
+
+    if CRUDMethod.PATCH in methods:
+
+        def patch(_self: MethodView, payload: dict, **kwargs: str | int | uuid.UUID | bool | None) -> BaseModel:
+            """Update resource."""
+            res = get_resource(kwargs)
+            res.update(**payload)
+            return res
+
+        patch = bp.response(_OK, methods[CRUDMethod.PATCH].get("schema", config.schema_cls))(patch)
+        patch = bp.doc(
+            responses={
+                **not_found_response,
+                _CONFLICT: {"description": "DB error."},
+            },
+            operationId=_operation_id("update", config.model_name),
+        )(patch)
+        attrs["patch"] = bp.arguments(update_schema)(patch)
+
+    if CRUDMethod.DELETE in methods:
+
+        def delete(_self: MethodView, **kwargs: str | int | uuid.UUID | bool | None) -> tuple[str, int]:
+            """Delete resource."""
+            res = get_resource(kwargs)
+            res.delete()
+            return "", _NO_CONTENT
+
+        delete = bp.doc(operationId=_operation_id("delete", config.model_name))(delete)
+        attrs["delete"] = bp.response(_NO_CONTENT, description=sys.intern(f"{config.name} deleted"))(delete)
+
+    return type("GenericCRUD", (MethodView,), attrs)
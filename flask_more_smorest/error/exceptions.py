@@ -101,13 +101,13 @@ class ApiException(Exception):
         debug_context.update(kwargs)
 
         if True:  # TODO: check if auth is enabled
-            from ..perms import current_user, get_current_user_id
+            from ..perms import get_current_user
 
             try:
-                if user_id := get_current_user_id():
+                if user := get_current_user():
                     debug_context["user"] = {
-                        "id": user_id,
-                        "roles": [r.role for r in current_user.roles],
+                        "id": user.id,
+                        "roles": [r.role for r in user.roles],
                     }
                 else:
                     debug_context["user"] = {
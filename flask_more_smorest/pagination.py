@@ -5,6 +5,24 @@ from flask_smorest.pagination import PaginationParameters
 from werkzeug.exceptions import BadRequest
 
 
+def _coerce_positive_int(name: str, value: Any, default: int) -> int:
+    """Coerce a pagination parameter to a positive integer.
+
+    Raises:
+        BadRequest: If the value is missing or not a positive integer
+    """
+    candidate = value if value is not None else default
+    if candidate is None:
+        raise BadRequest(f"Missing pagination parameter: {name}")
+    try:
+        int_value = int(candidate)
+    except (TypeError, ValueError) as exc:
+        raise BadRequest(f"{name} must be a positive integer") from exc
+    if int_value <= 0:
+        raise BadRequest(f"{name} must be a positive integer")
+    return int_value
+
+
 class CRUDPaginationMixin:
     """Mixin class to add custom pagination support to CRUDBlueprint."""
 
@@ -30,6 +48,15 @@ class CRUDPaginationMixin:
             return super().paginate(pager, page=page, page_size=page_size, max_page_size=max_page_size)  # type: ignore
 
         # Custom behavior for pager=None (manual pagination handling)
+        # Resolve header support once here rather than on every request
+        set_pagination_metadata = (
+            self._set_pagination_metadata  # type: ignore[attr-defined]
+            if getattr(self, "PAGINATION_HEADER_NAME", None) is not None
+            else None
+        )
+
+        p_size_default = page_size if page_size is not None else 10
+
         def decorator(func: Any) -> Any:
             @wraps(func)
             def wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -44,18 +71,6 @@ class CRUDPaginationMixin:
                 if filters is None:
                     filters = {}
 
-                def _coerce_positive_int(name: str, value: Any, default: int) -> int:
-                    candidate = value if value is not None else default
-                    if candidate is None:
-                        raise BadRequest(f"Missing pagination parameter: {name}")
-                    try:
-                        int_value = int(candidate)
-                    except (TypeError, ValueError) as exc:
-                        raise BadRequest(f"{name} must be a positive integer") from exc
-                    if int_value <= 0:
-                        raise BadRequest(f"{name} must be a positive integer")
-                    return int_value
-
                 # Extract values with fallbacks and validation
                 raw_page = filters.get("page")
                 if raw_page is None:
@@ -65,7 +80,6 @@ class CRUDPaginationMixin:
                 raw_page_size = filters.get("page_size")
                 if raw_page_size is None:
                     raw_page_size = page_size
-                p_size_default = page_size if page_size is not None else 10
                 p_size_val = _coerce_positive_int("page_size", raw_page_size, default=p_size_default)
 
                 # Create parameters object
@@ -75,10 +89,8 @@ class CRUDPaginationMixin:
                 kwargs["pagination_parameters"] = pagination_parameters
 
                 # Remove from filters so application logic doesn't see them as filters
-                if "page" in filters:
-                    del filters["page"]
-                if "page_size" in filters:
-                    del filters["page_size"]
+                filters.pop("page", None)
+                filters.pop("page_size", None)
 
                 # Execute decorated function
                 result = func(*args, **kwargs)
@@ -94,10 +106,8 @@ class CRUDPaginationMixin:
                         result, status = result
 
                 # Set pagination metadata
-                if getattr(self, "PAGINATION_HEADER_NAME", None) is not None:
-                    result, headers = self._set_pagination_metadata(  # type: ignore
-                        pagination_parameters, result, headers
-                    )
+                if set_pagination_metadata is not None:
+                    result, headers = set_pagination_metadata(pagination_parameters, result, headers)
 
                 return result, status, headers
 
@@ -27,6 +27,7 @@ from .user_models import (
     UserRole,
     UserSetting,
     current_user,
+    get_current_user,
     get_current_user_id,
 )
 
@@ -59,6 +60,7 @@ __all__ = [
     "Token",
     "UserSetting",
     "current_user",
+    "get_current_user",
     "get_current_user_id",
     "HasUserMixin",
     "UserOwnershipMixin",
@@ -4,7 +4,8 @@ This module provides an Api class that extends Flask-Smorest's Api with
 JWT authentication, permission checking, and custom schema name resolution.
 """
 
-from typing import TYPE_CHECKING
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
 from apispec.ext.marshmallow import MarshmallowPlugin
 from apispec.ext.marshmallow import resolver as default_resolver
@@ -99,23 +100,22 @@ class Api(ApiOrig):
 
         extensions_state = app.extensions.setdefault("flask-more-smorest", {})
         if not extensions_state.get("require_login_registered", False):
+            # Access flags per (endpoint, method): view functions are fixed once the app serves requests
+            endpoint_access: dict[tuple[str, str], tuple[bool, bool]] = {}
 
             @app.before_request
             def require_login() -> None:
-                if not request.endpoint or request.endpoint.startswith("api-docs"):
+                endpoint = request.endpoint
+                if not endpoint or endpoint.startswith("api-docs"):
                     return
                 admin_endpoint = False
-                if request.endpoint in app.view_functions:
-                    fn = app.view_functions[request.endpoint]
-                    public_endpoint = getattr(fn, "_is_public", False)
-                    admin_endpoint = getattr(fn, "_is_admin", False)
-                    if hasattr(fn, "view_class"):
-                        public_endpoint |= getattr(fn.view_class, "_is_public", False)
-                        admin_endpoint |= getattr(fn.view_class, "_is_admin", False)
-                        # Handle MethodView classes:
-                        if actual_method := getattr(fn.view_class, request.method.lower(), None):
-                            public_endpoint |= getattr(actual_method, "_is_public", False)
-                            admin_endpoint |= getattr(actual_method, "_is_admin", False)
+                fn = app.view_functions.get(endpoint)
+                if fn is not None:
+                    key = (endpoint, request.method)
+                    access = endpoint_access.get(key)
+                    if access is None:
+                        access = endpoint_access[key] = _resolve_endpoint_access(fn, request.method)
+                    public_endpoint, admin_endpoint = access
                     if public_endpoint and not admin_endpoint:
                         return
                 try:
@@ -138,6 +138,31 @@ class Api(ApiOrig):
             extensions_state["require_login_registered"] = True
 
 
+def _resolve_endpoint_access(fn: Callable[..., Any], method: str) -> tuple[bool, bool]:
+    """Collect the public/admin markers set by :class:`PermsBlueprintMixin`.
+
+    Markers may be set on the view function, on its MethodView class or on
+    the MethodView handler for ``method``.
+
+    Args:
+        fn: View function registered for the endpoint
+        method: HTTP method of the request
+
+    Returns:
+        Tuple of (public, admin) flags
+    """
+    public_endpoint = getattr(fn, "_is_public", False)
+    admin_endpoint = getattr(fn, "_is_admin", False)
+    if hasattr(fn, "view_class"):
+        public_endpoint |= getattr(fn.view_class, "_is_public", False)
+        admin_endpoint |= getattr(fn.view_class, "_is_admin", False)
+        # Handle MethodView classes:
+        if actual_method := getattr(fn.view_class, method.lower(), None):
+            public_endpoint |= getattr(actual_method, "_is_public", False)
+            admin_endpoint |= getattr(actual_method, "_is_admin", False)
+    return bool(public_endpoint), bool(admin_endpoint)
+
+
 def custom_schema_name_resolver(schema: type[Schema], **kwargs: str | bool) -> str:
     """Custom schema name resolver for OpenAPI spec.
 
@@ -151,7 +176,6 @@ def custom_schema_name_resolver(schema: type[Schema], **kwargs: str | bool) -> s
     Returns:
         Empty string for partial/filtered schemas, default name otherwise
     """
-    # print(schema.__class__.__name__, getattr(schema, 'exclude', False))
     if getattr(schema, "partial", False):
         return ""
         # return default_resolver(schema) + 'Partial'
@@ -5,13 +5,15 @@ permission checking functionality based on the current user context.
 """
 
 import logging
-from collections.abc import Callable, Iterator
-from contextlib import contextmanager
+import uuid
+from collections import deque
+from collections.abc import Callable
+from contextlib import AbstractContextManager
 from typing import Any, Self, cast
 
 import sqlalchemy as sa
-from flask import has_request_context
-from flask_jwt_extended import exceptions, verify_jwt_in_request
+from flask import has_request_context, request
+from flask_jwt_extended import exceptions
 from sqlalchemy.orm.state import InstanceState
 from werkzeug.exceptions import Unauthorized
 
@@ -20,6 +22,43 @@ from ..sqla import BaseModel as SQLABaseModel
 
 logger = logging.getLogger(__name__)
 
+_REQUEST_CACHE_KEY = "flask_more_smorest.perms_cache"
+
+
+def _request_cache() -> dict[str, Any] | None:
+    """Return a dict scoped to the current request, or None outside a request.
+
+    Used to memoize per-request authentication results (e.g. the admin check).
+    The cache lives in the WSGI environ rather than on ``flask.g`` because ``g``
+    belongs to the app context, which Flask reuses across request contexts pushed
+    within an already active app context.
+    """
+    if not has_request_context():
+        return None
+    cache: dict[str, Any] = request.environ.setdefault(_REQUEST_CACHE_KEY, {})
+    return cache
+
+
+class _BypassPerms:
+    """Context manager backing :meth:`BasePermsModel.bypass_perms`.
+
+    A plain class rather than a ``@contextmanager`` generator, since it is
+    commonly entered once per object in bulk admin scripts.
+    """
+
+    __slots__ = ("model_cls", "previous")
+
+    def __init__(self, model_cls: type["BasePermsModel"]) -> None:
+        self.model_cls = model_cls
+        self.previous = False
+
+    def __enter__(self) -> None:
+        self.previous = self.model_cls.perms_disabled
+        self.model_cls.perms_disabled = True
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.model_cls.perms_disabled = self.previous
+
 
 class BasePermsModel(SQLABaseModel):
     """Permission-aware Base model for all models.
@@ -40,6 +79,7 @@ class BasePermsModel(SQLABaseModel):
     """
 
     __abstract__ = True
+    __slots__ = ()
     perms_disabled = False
 
     def __init__(self, **kwargs: object) -> None:
@@ -53,25 +93,19 @@ class BasePermsModel(SQLABaseModel):
         super().__init__(**kwargs)
 
     @classmethod
-    @contextmanager
-    def bypass_perms(cls) -> Iterator[None]:
+    def bypass_perms(cls) -> AbstractContextManager[None]:
         """Context manager to bypass permissions for the class.
 
         Temporarily disables permission checking for this model class.
 
-        Yields:
-            None
+        Returns:
+            Context manager restoring the previous setting on exit
 
         Example:
             >>> with Article.bypass_perms():
             ...     article.delete()  # Deletes without permission check
         """
-        original = cls.perms_disabled
-        cls.perms_disabled = True
-        try:
-            yield
-        finally:
-            cls.perms_disabled = original
+        return _BypassPerms(cls)
 
     def _should_bypass_perms(self) -> bool:
         """Check if permissions should be bypassed.
@@ -218,9 +252,21 @@ class BasePermsModel(SQLABaseModel):
                 returns ``None``.
               - Otherwise, a :class:`ForbiddenError` is raised.
         """
+        return cls._readable_or_none(super().get_by(**kwargs))
+
+    @classmethod
+    def get(cls, id: uuid.UUID | str) -> Self | None:
+        """Get resource by ID with permission check.
+
+        Same behavior as :meth:`get_by` when the resource is not readable.
+        """
+        return cls._readable_or_none(super().get(id))
+
+    @classmethod
+    def _readable_or_none(cls, res: Self | None) -> Self | None:
+        """Apply the read permission policy of :meth:`get_by` to a fetched resource."""
         from flask import current_app
 
-        res = super().get_by(**kwargs)
         if res is None:
             return None
 
@@ -237,21 +283,40 @@ class BasePermsModel(SQLABaseModel):
     def is_current_user_admin(cls) -> bool:
         """Check if current user is an admin.
 
+        The result is memoized for the duration of the request, so checking
+        permissions on many objects only verifies the JWT once. Outside of a
+        request context this is always False.
+
         Returns:
             True if current user is admin, False otherwise
         """
-        from .user_models import current_user
+        cache = _request_cache()
+        if cache is None:
+            # No request means no JWT to verify, so nobody can be an admin
+            return False
+        if "is_admin" in cache:
+            return bool(cache["is_admin"])
+
+        is_admin = cache["is_admin"] = cls._check_current_user_admin()
+        return is_admin
+
+    @classmethod
+    def _check_current_user_admin(cls) -> bool:
+        """Check the current user's admin status.
+
+        Goes through :func:`get_current_user`, so the JWT is verified at most
+        once per request even when ownership checks also need the user. That
+        function already treats JWT errors as an anonymous request.
+
+        Returns:
+            True if current user is admin, False otherwise
+        """
+        from .user_models import get_current_user
 
         try:
-            verify_jwt_in_request()
-            if current_user.is_admin:
+            user = get_current_user()
+            if user is not None and user.is_admin:
                 return True
-        except (exceptions.JWTExtendedException, Unauthorized):
-            logger.debug(
-                "JWT verification failed or unauthorized when checking admin status",
-                exc_info=True,
-            )
-            return False
         except RuntimeError as exc:
             logger.debug(
                 "Runtime error during admin check (likely outside request context): %s",
@@ -264,28 +329,33 @@ class BasePermsModel(SQLABaseModel):
 
         return False
 
-    def check_create(self, val: list | set | tuple | object, _visited: set[int] | None = None) -> None:
-        """Recursively check that all BaseModel instances can be created.
+    def check_create(self, val: list | set | tuple | object) -> None:
+        """Check that all BasePermsModel instances in ``val`` can be created.
+
+        Nested lists, sets and tuples are walked iteratively, visiting each
+        object once so that cyclic structures terminate.
 
         Args:
             val: Value or collection of values to check
-            _visited: Internal set of visited object ids to prevent infinite recursion
 
         Raises:
             ForbiddenError: If any nested object cannot be created
         """
-        if _visited is None:
-            _visited = set()
-
-        obj_id = id(val)
-        if obj_id in _visited:
-            # Cycle detected; stop descending further to avoid infinite recursion
+        if not has_request_context():
+            # can_create() always allows creation outside of a request
             return
-        _visited.add(obj_id)
-
-        if isinstance(val, BasePermsModel):
-            if getattr(sa.inspect(val), "transient", False) and not val.can_create():
-                raise ForbiddenError(f"User not allowed to create resource: {val}")
-        elif isinstance(val, list) or isinstance(val, set) or isinstance(val, tuple):
-            for x in val:
-                self.check_create(x, _visited=_visited)
+
+        pending: deque[object] = deque((val,))
+        visited: set[int] = set()
+        while pending:
+            item = pending.popleft()
+            item_id = id(item)
+            if item_id in visited:
+                continue
+            visited.add(item_id)
+
+            if isinstance(item, BasePermsModel):
+                if getattr(sa.inspect(item), "transient", False) and not item.can_create():
+                    raise ForbiddenError(f"User not allowed to create resource: {item}")
+            elif isinstance(item, (list, set, tuple)):
+                pending.extend(item)
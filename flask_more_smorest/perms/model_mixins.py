@@ -6,17 +6,74 @@ functionality to User models and other models in Flask-More-Smorest.
 
 import datetime as dt
 import uuid
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 import sqlalchemy as sa
 from sqlalchemy.ext.declarative import declared_attr
-from sqlalchemy.orm import Mapped, backref, mapped_column, relationship, synonym
+from sqlalchemy.orm import Mapped, backref, mapped_column, relationship
 
-from flask_more_smorest.error.exceptions import ForbiddenError
+from flask_more_smorest.sqla import db
 
 if TYPE_CHECKING:
     from .user_models import User
 
+_MISSING = object()
+
+# Names of relationships User declares itself; never generate a backref over them
+_RESERVED_BACKREFS = frozenset({"user_roles", "user_settings", "tokens"})
+
+
+def _load_current_user_id() -> uuid.UUID | None:
+    """Resolve ``get_current_user_id`` on first use, then call it.
+
+    ``user_models`` imports this module, so the function cannot be imported at
+    module level; after the first call ``_current_user_id`` is rebound to it and
+    permission checks no longer go through the import system.
+    """
+    global _current_user_id
+    from .user_models import get_current_user_id
+
+    _current_user_id = get_current_user_id
+    return get_current_user_id()
+
+
+_current_user_id: Callable[[], uuid.UUID | None] = _load_current_user_id
+
+
+def _user_has_attribute(name: str) -> bool:
+    """Check ``User`` for ``name``, importing it lazily as ``user_models`` imports this module."""
+    from .user_models import User
+
+    return hasattr(User, name)
+
+
+class _AliasDescriptor:
+    """Plain attribute alias for a mapped attribute.
+
+    Used instead of :func:`sqlalchemy.orm.synonym` for the configurable
+    ``user_id``/``user`` aliases. Instance reads return the loaded value from
+    ``__dict__`` directly, falling back to the instrumented attribute when it is
+    not loaded yet; writes go through the instrumented attribute. Class-level
+    access returns the target attribute so the alias still works in queries.
+    """
+
+    __slots__ = ("target",)
+
+    def __init__(self, target: str) -> None:
+        self.target = target
+
+    def __get__(self, instance: object | None, owner: type) -> Any:
+        if instance is None:
+            return getattr(owner, self.target)
+        value = instance.__dict__.get(self.target, _MISSING)
+        if value is _MISSING:
+            return getattr(instance, self.target)
+        return value
+
+    def __set__(self, instance: object, value: Any) -> None:
+        setattr(instance, self.target, value)
+
 
 class HasUserMixin:
     """Mixin to add user ID foreign key to a model.
@@ -29,6 +86,10 @@ class HasUserMixin:
         - ``__user_relationship_name__``: custom alias for ``user``
         - ``__user_id_nullable__``: allow NULL owner IDs
         - ``__user_backref_name__``: custom backref name on User model
+        - ``__user_relationship_lazy__``: loader strategy for the user relationship
+          (default ``"selectin"``; e.g. ``"raise"`` to require explicit loader options)
+        - ``__user_backref_lazy__``: loader strategy for the generated backref collection
+          (default ``"dynamic"``; e.g. ``"selectin"`` for small collections)
 
     Backref Configuration:
         - ``None`` (default): Auto-generate as ``{tablename}s`` (e.g., "articles")
@@ -57,27 +118,44 @@ class HasUserMixin:
         ...     content: Mapped[str] = mapped_column(sa.Text)
     """
 
+    __slots__ = ()
+
     __user_field_name__ = "user_id"
     __user_relationship_name__ = "user"
     __user_id_nullable__ = False
     __user_backref_name__: str | None = None  # None means auto-generate
+    __user_relationship_lazy__ = "selectin"
+    __user_backref_lazy__ = "dynamic"
+
+    _user_field_alias_value = "user_id"
+    _user_relationship_alias_value = "user"
+    _user_nullable_value = False
+    _user_relationship_lazy_value = "selectin"
+    _user_backref_lazy_value = "dynamic"
 
     def __init_subclass__(cls, **kwargs: Any):
         """Configure user field and relationship aliases on subclass creation."""
+        # Resolve the configuration once, before declarative mapping runs the
+        # declared_attrs below, so they read plain class attributes
+        cls._user_field_alias_value = str(cls.__user_field_name__)
+        cls._user_relationship_alias_value = str(cls.__user_relationship_name__)
+        cls._user_nullable_value = bool(cls.__user_id_nullable__)
+        cls._user_relationship_lazy_value = str(cls.__user_relationship_lazy__)
+        cls._user_backref_lazy_value = str(cls.__user_backref_lazy__)
         super().__init_subclass__(**kwargs)
         cls._configure_user_aliases()
 
     @classmethod
     def _user_column_nullable(cls) -> bool:
-        return bool(getattr(cls, "__user_id_nullable__", False))
+        return cls._user_nullable_value
 
     @classmethod
     def _user_field_alias(cls) -> str:
-        return str(getattr(cls, "__user_field_name__", "user_id"))
+        return cls._user_field_alias_value
 
     @classmethod
     def _user_relationship_alias(cls) -> str:
-        return str(getattr(cls, "__user_relationship_name__", "user"))
+        return cls._user_relationship_alias_value
 
     @classmethod
     def _user_backref_name(cls) -> str | None:
@@ -96,15 +174,15 @@ class HasUserMixin:
 
     @classmethod
     def _configure_user_aliases(cls) -> None:
-        field_alias = cls._user_field_alias()
-        rel_alias = cls._user_relationship_alias()
+        field_alias = cls._user_field_alias_value
+        rel_alias = cls._user_relationship_alias_value
 
         if field_alias and field_alias != "user_id" and not hasattr(cls, field_alias):
-            setattr(cls, field_alias, synonym("user_id"))
+            setattr(cls, field_alias, _AliasDescriptor("user_id"))
             cls._copy_annotation("user_id", field_alias)
 
         if rel_alias and rel_alias != "user" and not hasattr(cls, rel_alias):
-            setattr(cls, rel_alias, synonym("user"))
+            setattr(cls, rel_alias, _AliasDescriptor("user"))
             cls._copy_annotation("user", rel_alias)
 
     @classmethod
@@ -124,7 +202,7 @@ class HasUserMixin:
         """User ID foreign key with optional nullability."""
         from .user_models import get_current_user_id
 
-        nullable = cls._user_column_nullable()
+        nullable = cls._user_nullable_value
         default_callable = None if nullable else get_current_user_id
 
         return mapped_column(
@@ -140,22 +218,21 @@ class HasUserMixin:
         backref_name = cls._user_backref_name()
 
         # Add backref to User model, unless it already exists or is explicitly disabled
-        from .user_models import User
-
-        if backref_name and (hasattr(User, backref_name) or backref_name in ("user_roles", "user_settings", "tokens")):
+        if backref_name and (backref_name in _RESERVED_BACKREFS or _user_has_attribute(backref_name)):
             backref_arg = None
         elif backref_name:
             backref_arg = backref(
                 backref_name,
                 cascade="all, delete-orphan",
                 passive_deletes=True,
-                lazy="dynamic",
+                lazy=cls._user_backref_lazy_value,
             )
         else:
             # backref_name is None, skip backref
             backref_arg = None
 
-        return relationship("User", lazy="joined", foreign_keys=[cls.user_id], backref=backref_arg)  # type: ignore[list-item]
+        lazy = cls._user_relationship_lazy_value
+        return relationship("User", lazy=lazy, foreign_keys=[cls.user_id], backref=backref_arg)  # type: ignore[list-item,arg-type]
 
 
 class UserOwnershipMixin(HasUserMixin):
@@ -191,6 +268,8 @@ class UserOwnershipMixin(HasUserMixin):
         ...     # Permission: delegates to self.user._can_write()
     """
 
+    __slots__ = ()
+
     __user_id_nullable__ = False
     __delegate_to_user__ = False
 
@@ -205,9 +284,7 @@ class UserOwnershipMixin(HasUserMixin):
             return self.user._can_write()
         else:
             # Simple ownership check
-            from .user_models import get_current_user_id
-
-            return self.user_id == get_current_user_id()
+            return self.user_id == _current_user_id()
 
     def _can_read(self) -> bool:
         """Check if current user can read this resource.
@@ -220,9 +297,7 @@ class UserOwnershipMixin(HasUserMixin):
             return self._can_write()
         else:
             # Simple ownership check
-            from .user_models import get_current_user_id
-
-            return self.user_id == get_current_user_id()
+            return self.user_id == _current_user_id()
 
     def _can_create(self) -> bool:
         """Check if current user can create this resource.
@@ -234,15 +309,17 @@ class UserOwnershipMixin(HasUserMixin):
             # Simple mode: use default behavior
             return True
 
-        # Delegation mode: check user's permission
-        if self.user_id:
-            from .user_models import User
+        from .user_models import User
 
-            try:
-                user = User.get_or_404(self.user_id)
-            except ForbiddenError:
+        # Delegation mode: check user's permission, preferring the already
+        # loaded relationship and then the identity map over a fresh query
+        user: User | None = self.user
+        if user is None and self.user_id:
+            user = db.session.get(User, self.user_id)
+            if user is None:
                 return False
 
+        if user is not None:
             return user._can_write()
 
         return self._can_write()
@@ -61,22 +61,26 @@ All User instances (including subclasses) automatically inherit:
 - CRUD operation permissions
 """
 
+import datetime as dt
 import enum
 import logging
 import os
 import uuid
-from typing import TYPE_CHECKING
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Self, cast
 
+import jwt
 import sqlalchemy as sa
+from flask import current_app
 from flask_jwt_extended import current_user as jwt_current_user
 from flask_jwt_extended import exceptions, verify_jwt_in_request
 from sqlalchemy.ext.declarative import declared_attr
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import InstanceState, Mapped, mapped_column, object_session, raiseload, relationship, selectinload
 
 from ..error.exceptions import UnprocessableEntity
 from ..sqla import db
-from ..utils import check_password_hash, generate_password_hash
-from .base_perms_model import BasePermsModel
+from ..utils import check_password_hash, forget_password_hash, generate_password_hash
+from .base_perms_model import BasePermsModel, _request_cache
 from .model_mixins import UserOwnershipMixin
 
 if TYPE_CHECKING:
@@ -84,11 +88,66 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# bcrypt only uses the first 72 bytes of a password (and bcrypt>=5 rejects longer ones)
+_BCRYPT_MAX_PASSWORD_BYTES = 72
+
+
+def _check_password_length(password: str) -> None:
+    """Reject passwords that bcrypt cannot hash in full.
+
+    Raises:
+        UnprocessableEntity: If the password is longer than 72 bytes once UTF-8 encoded
+    """
+    if len(password.encode("utf-8")) > _BCRYPT_MAX_PASSWORD_BYTES:
+        raise UnprocessableEntity(
+            fields={"password": f"Cannot be longer than {_BCRYPT_MAX_PASSWORD_BYTES} bytes"},
+            message="Password is too long",
+            location="json",
+        )
+
 
 # Set the current_user reference to JWT current user
 current_user: "User" = jwt_current_user
 
 
+def get_current_user() -> "User | None":
+    """Get the authenticated user for the current request.
+
+    The JWT is verified and the user loaded once per request; later calls in
+    the same request return the memoized result. Apps that did not call
+    :func:`init_jwt` have no authenticated users.
+
+    Returns:
+        Current user if authenticated, None otherwise
+
+    Example:
+        >>> user = get_current_user()
+        >>> if user is not None and user.is_admin:
+        ...     print(f"Admin {user.email} is authenticated")
+    """
+    cache = _request_cache()
+    if cache is None:
+        # Outside of a request there is no JWT to authenticate with
+        return None
+    if "current_user" in cache:
+        user: User | None = cache["current_user"]
+        return user
+
+    if "flask-jwt-extended" not in current_app.extensions:
+        # JWT support is optional (see init_jwt): without it every request is anonymous
+        user = None
+    else:
+        try:
+            verify_jwt_in_request()
+            user = jwt_current_user._get_current_object()
+        except (exceptions.JWTExtendedException, jwt.PyJWTError):
+            # Missing, invalid or expired token, or unknown user: anonymous request
+            user = None
+
+    cache["current_user"] = user
+    return user
+
+
 def get_current_user_id() -> uuid.UUID | None:
     """Get current user ID if authenticated.
 
@@ -100,14 +159,8 @@ def get_current_user_id() -> uuid.UUID | None:
         >>> if user_id:
         ...     print(f"User {user_id} is authenticated")
     """
-    try:
-        verify_jwt_in_request()
-        return current_user.id
-    except exceptions.JWTDecodeError:
-        return None
-    except Exception as e:
-        logger.exception("Error getting current user ID: %s", e)
-        return None
+    user = get_current_user()
+    return user.id if user is not None else None
 
 
 # Default role enum - can be overridden via UserRole subclasses
@@ -119,6 +172,10 @@ class DefaultUserRole(str, enum.Enum):
     USER = "user"
 
 
+# Roles that only a superadmin may grant or modify
+_ADMIN_ROLE_VALUES = frozenset({DefaultUserRole.SUPERADMIN.value, DefaultUserRole.ADMIN.value})
+
+
 class User(BasePermsModel):
     """Concrete User model with role-based permissions and domain support.
 
@@ -200,12 +257,18 @@ class User(BasePermsModel):
     # Using enable_typechecks=False to allow UserRole subclasses
     @declared_attr
     def roles(cls) -> Mapped[list["UserRole"]]:
-        """Relationship to user roles - inherited by all User models."""
+        """Relationship to user roles - inherited by all User models.
+
+        Roles back every permission check, so they are loaded with a single
+        extra SELECT ... IN query for all users in a result rather than one
+        query per user.
+        """
         return relationship(
             "UserRole",
             back_populates="user",
             cascade="all, delete-orphan",
             enable_typechecks=False,  # Allow UserRole subclasses
+            lazy="selectin",
         )
 
     @declared_attr
@@ -218,6 +281,30 @@ class User(BasePermsModel):
         """Relationship to user tokens - inherited by all User models."""
         return relationship("Token", back_populates="user", cascade="all, delete-orphan")
 
+    @classmethod
+    def with_perms_loaded(cls, *, raise_on_lazy_load: bool = True) -> sa.Select[tuple[Self]]:
+        """Build a query loading users together with everything permission checks need.
+
+        Roles are fetched with one ``SELECT ... IN`` query and their domains are
+        joined in, so ``is_admin``, ``has_role()`` and ``has_domain_access()`` never
+        hit the database per user.
+
+        Args:
+            raise_on_lazy_load: Make any other relationship raise on access instead of
+                silently emitting a query (default: True)
+
+        Returns:
+            Select statement to refine and execute
+
+        Example:
+            >>> stmt = User.with_perms_loaded().where(User.is_enabled)
+            >>> users = db.session.execute(stmt).scalars().all()
+        """
+        options = [selectinload(cls.roles).joinedload(UserRole.domain)]
+        if raise_on_lazy_load:
+            options.append(raiseload("*"))
+        return sa.select(cls).options(*options)
+
     def __init__(self, **kwargs: object):
         """Create new user with optional password hashing."""
         password = kwargs.pop("password", None)
@@ -228,21 +315,34 @@ class User(BasePermsModel):
             self.set_password(password)
 
     def set_password(self, password: str) -> None:
-        """Set password with secure hashing."""
+        """Set password with secure hashing.
+
+        Raises:
+            UnprocessableEntity: If the password is longer than bcrypt's 72-byte limit
+        """
+        _check_password_length(password)
+        forget_password_hash(self.password)
         self.password = generate_password_hash(password)
 
     def is_password_correct(self, password: str) -> bool:
         """Check if provided password matches stored hash."""
-        if self.password is None:
+        if self.password is None or not isinstance(password, str) or not password:
             return False
-        return isinstance(password, str) and check_password_hash(password=password, hashed=self.password)
+        encoded = password.encode("utf-8")
+        if len(encoded) > _BCRYPT_MAX_PASSWORD_BYTES:
+            # set_password() rejects such passwords, but older hashes were made from the
+            # first 72 bytes; compare that prefix explicitly, as bcrypt>=5 raises instead
+            encoded = encoded[:_BCRYPT_MAX_PASSWORD_BYTES]
+        return check_password_hash(password=encoded, hashed=self.password)
 
     def update(self, commit: bool = True, **kwargs: str | int | float | bool | bytes | None) -> None:
         """Update user with password handling."""
         password = kwargs.pop("password", None)
         old_password = kwargs.pop("old_password", None)
 
-        if password and not getattr(self, "perms_disabled", False):
+        if password:
+            _check_password_length(str(password))
+        if password and not self.perms_disabled:
             if old_password is None:
                 raise UnprocessableEntity(
                     fields={"old_password": "Cannot be empty"},
@@ -260,12 +360,12 @@ class User(BasePermsModel):
             self.set_password(str(password))
         self.save(commit=commit)
 
-    @property
+    @cached_property
     def is_admin(self) -> bool:
         """Check if user has admin privileges."""
         return self.has_role(DefaultUserRole.ADMIN) or self.is_superadmin
 
-    @property
+    @cached_property
     def is_superadmin(self) -> bool:
         """Check if user has superadmin privileges."""
         return self.has_role(DefaultUserRole.SUPERADMIN)
@@ -289,25 +389,50 @@ class User(BasePermsModel):
         # Normalize role to string for comparison
         role_str = role.value if isinstance(role, enum.Enum) else str(role)
 
-        return any(
-            r.role == role_str
-            and (domain_name is None or r.domain is None or r.domain.name == domain_name or r.domain.name == "*")
-            for r in self.roles
-        )
+        if "_role_index" not in self.__dict__:
+            state = cast(InstanceState[Any], sa.inspect(self))
+            if state.persistent and "roles" not in state.dict:
+                # Roles not loaded: ask the database instead of loading them all
+                return self._has_role_in_db(role_str, domain_name)
+
+        domain_names = self._role_index.get(role_str)
+        if domain_names is None:
+            return False
+        return domain_name is None or domain_name in domain_names or None in domain_names or "*" in domain_names
+
+    def _has_role_in_db(self, role: str, domain_name: str | None) -> bool:
+        """Check a role with a single EXISTS query, mirroring :meth:`has_role`."""
+        condition = sa.and_(UserRole.user_id == self.id, UserRole._role == role)
+        if domain_name is not None:
+            matching_domains = sa.select(Domain.id).where(Domain.name.in_((domain_name, "*")))
+            condition = sa.and_(
+                condition, sa.or_(UserRole.domain_id.is_(None), UserRole.domain_id.in_(matching_domains))
+            )
+        session = object_session(self) or db.session
+        return bool(session.scalar(sa.select(sa.exists().where(condition))))
+
+    @cached_property
+    def _role_index(self) -> dict[str, frozenset[str | None]]:
+        """Domain names per role held by the user, ``None`` meaning all domains.
+
+        Built on first use and dropped by the listeners at the bottom of this module
+        whenever the user's roles change or the instance is expired or refreshed.
+        """
+        index: dict[str, set[str | None]] = {}
+        for r in self.roles:
+            index.setdefault(r.role, set()).add(r.domain.name if r.domain else None)
+        return {role: frozenset(names) for role, names in index.items()}
 
     def _can_write(self) -> bool:
         """Default write permission: users can edit their own profile."""
-        try:
-            return self.id == get_current_user_id()
-        except Exception:
-            return False
+        return self.id == get_current_user_id()
 
     def _can_create(self) -> bool:
         """Default create permission: admins can create users."""
-        try:
-            return current_user.is_admin
-        except Exception:
+        user = get_current_user()
+        if user is None:
             return True  # Allow during testing/setup
+        return user.is_admin
 
     # Concrete methods that use relationships - available to all User models
     @property
@@ -318,11 +443,36 @@ class User(BasePermsModel):
     @property
     def domain_ids(self) -> set[uuid.UUID | str]:
         """Return set of domain IDs the user has roles for."""
-        return {r.domain_id or "*" for r in self.roles}
+        ids, wildcard = self._domain_index
+        domain_ids: set[uuid.UUID | str] = set(ids)
+        if wildcard:
+            domain_ids.add("*")
+        return domain_ids
 
     def has_domain_access(self, domain_id: uuid.UUID | None) -> bool:
         """Check if user has access to specified domain."""
-        return domain_id is None or domain_id in self.domain_ids or "*" in self.domain_ids
+        if domain_id is None:
+            return True
+        ids, wildcard = self._domain_index
+        return wildcard or domain_id in ids
+
+    @cached_property
+    def _domain_index(self) -> tuple[frozenset[uuid.UUID], bool]:
+        """Domain IDs of the user's roles, and whether any role applies to all domains.
+
+        Memoized and invalidated like :attr:`_role_index`.
+        """
+        ids: set[uuid.UUID] = set()
+        wildcard = False
+        for r in self.roles:
+            if r.domain_id is None:
+                wildcard = True
+            else:
+                ids.add(r.domain_id)
+        return frozenset(ids), wildcard
+
+
+_DEFAULT_DOMAIN_CACHE_KEY = "default_domain_id"
 
 
 class Domain(BasePermsModel):
@@ -334,9 +484,27 @@ class Domain(BasePermsModel):
 
     @classmethod
     def get_default_domain_id(cls) -> uuid.UUID | None:
-        """Get the default domain ID from environment or first available."""
+        """Get the default domain ID from environment or first available.
+
+        The result is memoized for the duration of the request and dropped
+        whenever a domain is inserted, updated or deleted.
+        """
+        default_domain_name = os.getenv("DEFAULT_DOMAIN_NAME")
+        cache = _request_cache()
+        if cache is not None:
+            cached: tuple[str | None, uuid.UUID | None] | None = cache.get(_DEFAULT_DOMAIN_CACHE_KEY)
+            if cached is not None and cached[0] == default_domain_name:
+                return cached[1]
+
+        domain_id = cls._lookup_default_domain_id(default_domain_name)
+        if cache is not None:
+            cache[_DEFAULT_DOMAIN_CACHE_KEY] = (default_domain_name, domain_id)
+        return domain_id
+
+    @classmethod
+    def _lookup_default_domain_id(cls, default_domain: str | None) -> uuid.UUID | None:
         domain: Domain | None
-        if default_domain := os.getenv("DEFAULT_DOMAIN_NAME"):
+        if default_domain:
             domain = cls.get_by(name=default_domain)
             if domain:
                 return domain.id
@@ -440,29 +608,25 @@ class UserRole(BasePermsModel):
 
     def _can_write(self) -> bool:
         """Permission check for modifying roles."""
-        try:
-            # Check against default admin roles
-            admin_roles = {
-                DefaultUserRole.SUPERADMIN.value,
-                DefaultUserRole.ADMIN.value,
-            }
-
-            if self._role in admin_roles:
-                return current_user.has_role(DefaultUserRole.SUPERADMIN)
-            return current_user.has_role(DefaultUserRole.ADMIN)
-        except Exception:
+        user = get_current_user()
+        if user is None:
             return False
 
+        # Check against default admin roles
+        if self._role in _ADMIN_ROLE_VALUES:
+            return user.has_role(DefaultUserRole.SUPERADMIN)
+        return user.has_role(DefaultUserRole.ADMIN)
+
     def _can_create(self) -> bool:
         """Permission check for creating roles."""
         return self._can_write()
 
     def _can_read(self) -> bool:
         """Permission check for reading roles."""
-        try:
-            return self.user._can_read()
-        except Exception:
+        user: User | None = self.user
+        if user is None:  # transient role not yet attached to a user
             return True
+        return user._can_read()
 
 
 class Token(UserOwnershipMixin, BasePermsModel):
@@ -472,9 +636,9 @@ class Token(UserOwnershipMixin, BasePermsModel):
 
     token: Mapped[str] = mapped_column(db.String(1024), nullable=False)
     description: Mapped[str | None] = mapped_column(db.String(64), nullable=True)
-    expires_at: Mapped[sa.DateTime | None] = mapped_column(sa.DateTime(), nullable=True)
+    expires_at: Mapped[dt.datetime | None] = mapped_column(sa.DateTime(), nullable=True)
     revoked: Mapped[bool] = mapped_column(db.Boolean(), nullable=False, default=False)
-    revoked_at: Mapped[sa.DateTime | None] = mapped_column(sa.DateTime(), nullable=True)
+    revoked_at: Mapped[dt.datetime | None] = mapped_column(sa.DateTime(), nullable=True)
 
 
 class UserSetting(UserOwnershipMixin, BasePermsModel):
@@ -486,3 +650,76 @@ class UserSetting(UserOwnershipMixin, BasePermsModel):
     value: Mapped[str | None] = mapped_column(db.String(1024), nullable=True)
 
     __table_args__ = (db.UniqueConstraint("user_id", "key"),)
+
+
+# Attributes memoized on User instances from their roles (see User._role_index)
+_ROLE_CACHE_ATTRS: tuple[str, ...] = ("_role_index", "_domain_index", "is_admin", "is_superadmin")
+
+
+def _clear_role_caches(user: User | None) -> None:
+    """Drop role-derived values memoized on ``user``.
+
+    ``user`` may be None when SQLAlchemy expires the state of an instance that
+    has already been garbage collected.
+    """
+    instance_dict: dict[str, Any] | None = getattr(user, "__dict__", None)
+    if instance_dict:
+        for attr in _ROLE_CACHE_ATTRS:
+            instance_dict.pop(attr, None)
+
+
+@sa.event.listens_for(User.roles, "append", propagate=True)
+@sa.event.listens_for(User.roles, "remove", propagate=True)
+def _on_user_roles_changed(target: User, value: object, initiator: object) -> None:
+    _clear_role_caches(target)
+
+
+@sa.event.listens_for(User, "expire", propagate=True)
+def _on_user_expired(target: User | None, attrs: object) -> None:
+    _clear_role_caches(target)
+
+
+@sa.event.listens_for(User, "refresh", propagate=True)
+def _on_user_refreshed(target: User | None, context: object, attrs: object) -> None:
+    _clear_role_caches(target)
+
+
+def _loaded_role_user(role: UserRole) -> User | None:
+    """Return the role's user if it is already in memory, without loading it."""
+    state = cast(InstanceState[Any], sa.inspect(role))
+    user: User | None = state.dict.get("user")
+    if user is None and state.session is not None and role.user_id is not None:
+        # User subclasses may have their own identity class, so check each mapper
+        identity_map = state.session.identity_map
+        for mapper in sa.inspect(User).self_and_descendants:
+            user = cast("User | None", identity_map.get(mapper.identity_key_from_primary_key([role.user_id])))
+            if user is not None:
+                break
+    return user
+
+
+@sa.event.listens_for(UserRole._role, "set", propagate=True)
+@sa.event.listens_for(UserRole.domain_id, "set", propagate=True)
+@sa.event.listens_for(UserRole.domain, "set", propagate=True)
+def _on_user_role_changed(target: UserRole, value: object, oldvalue: object, initiator: object) -> None:
+    # Only look at an already loaded user; never trigger a lazy load from an event
+    user: User | None = sa.inspect(target).dict.get("user")
+    if user is not None:
+        _clear_role_caches(user)
+
+
+@sa.event.listens_for(UserRole, "after_insert", propagate=True)
+@sa.event.listens_for(UserRole, "after_update", propagate=True)
+@sa.event.listens_for(UserRole, "after_delete", propagate=True)
+def _on_user_role_flushed(mapper: object, connection: object, target: UserRole) -> None:
+    # Covers roles added or removed through user_id rather than the User.roles collection
+    _clear_role_caches(_loaded_role_user(target))
+
+
+@sa.event.listens_for(Domain, "after_insert", propagate=True)
+@sa.event.listens_for(Domain, "after_update", propagate=True)
+@sa.event.listens_for(Domain, "after_delete", propagate=True)
+def _on_domain_changed(mapper: object, connection: object, target: Domain) -> None:
+    cache = _request_cache()
+    if cache is not None:
+        cache.pop(_DEFAULT_DOMAIN_CACHE_KEY, None)
@@ -6,8 +6,8 @@ that includes automatic Marshmallow schema generation and common CRUD operations
 
 import datetime as dt
 import uuid
-from collections.abc import Iterable, Iterator
-from contextlib import contextmanager
+from collections.abc import Iterable
+from contextlib import AbstractContextManager, nullcontext
 from typing import Any, Self, TypeAlias, cast
 
 import sqlalchemy as sa
@@ -279,8 +279,9 @@ class BaseModel(db.Model, metaclass=BaseModelMeta):  # type: ignore[name-defined
             Dictionary with UUID strings converted to UUID objects
         """
         normalized = fields.copy()
+        columns = class_mapper(cls).columns
         for key, val in fields.items():
-            col = class_mapper(cls).columns[key]
+            col = columns[key]
             if isinstance(col.type, sa.types.Uuid) and val is not None:
                 if not isinstance(val, (str, uuid.UUID)):
                     raise TypeError(f"Expected str or UUID for field {key}, got {type(val)}")
@@ -341,16 +342,26 @@ class BaseModel(db.Model, metaclass=BaseModelMeta):  # type: ignore[name-defined
     def get(cls, id: uuid.UUID | str) -> Self | None:
         """Get resource by ID.
 
+        Uses :meth:`Session.get`, so an instance already in the session's
+        identity map is returned without querying the database.
+
         Args:
             id: Resource ID (UUID or UUID string)
 
         Returns:
             The matching model instance, or None if not found
 
+        Raises:
+            TypeError: If ID is not a valid UUID string or UUID object
+
         Example:
             >>> user = User.get('123e4567-e89b-12d3-a456-426614174000')
         """
-        return cls.get_by(id=id)
+        pk = cls._normalize_uuid_fields({"id": id})["id"]
+
+        # don't automatically flush the session to avoid side effects
+        with db.session.no_autoflush:
+            return db.session.get(cls, pk)
 
     @classmethod
     def get_or_404(cls, id: uuid.UUID | str) -> Self:
@@ -387,10 +398,9 @@ class BaseModel(db.Model, metaclass=BaseModelMeta):  # type: ignore[name-defined
             raise NotFoundError(f"{cls.__name__} id {id} doesn't exist")
 
     @classmethod
-    @contextmanager
-    def bypass_perms(cls) -> Iterator[None]:
+    def bypass_perms(cls) -> AbstractContextManager[None]:
         """No-op context manager for base class (overridden in perms model)."""
-        yield
+        return nullcontext()
 
     def save(self, commit: bool = True) -> Self:
         """Save the record: add to session and optionally commit.
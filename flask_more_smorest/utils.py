@@ -4,14 +4,38 @@ This module provides common utility functions for password hashing
 and string case conversion.
 """
 
+import hashlib
+import hmac
+import os
 import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 
 import bcrypt
+from flask import current_app, has_app_context
+
+# bcrypt cost factor; each step doubles the hashing time. Lower it only for tests.
+_BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", "12"))
+
+# Bounded LRU of (HMAC of password, bcrypt hash) pairs that verified successfully.
+# Only positive results are stored, so failed guesses always pay the full bcrypt cost.
+_VERIFIED_PASSWORDS_MAXSIZE = 1024
+_verified_passwords: OrderedDict[tuple[bytes, bytes], None] = OrderedDict()
+_verified_passwords_lock = threading.Lock()
+
+# Word boundaries in CamelCase: a lowercase letter or digit followed by an uppercase
+# letter ("userProfile"), or an uppercase letter starting a lowercase run after any
+# character ("APIKey"). Matching positions lets one sub() pass insert the underscores.
+_CAMEL_BOUNDARY_RE = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|(?<=.)(?=[A-Z][a-z])")
 
 
 def generate_password_hash(password: str | bytes) -> bytes:
     """Generate a secure bcrypt hash for a password.
 
+    The cost factor defaults to 12 and can be overridden with the
+    ``BCRYPT_ROUNDS`` environment variable, read at import time.
+
     Args:
         password: The password to hash (string or bytes)
 
@@ -25,7 +49,7 @@ def generate_password_hash(password: str | bytes) -> bytes:
     """
     if isinstance(password, str):
         password = password.encode("utf-8")
-    return bcrypt.hashpw(password, bcrypt.gensalt())
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds=_BCRYPT_ROUNDS))
 
 
 def check_password_hash(password: str | bytes | None, hashed: bytes | str | None) -> bool:
@@ -51,9 +75,57 @@ def check_password_hash(password: str | bytes | None, hashed: bytes | str | None
         password = password.encode("utf-8")
     if isinstance(hashed, str):
         hashed = hashed.encode("utf-8")
-    return bcrypt.checkpw(password, hashed)
 
+    cache_key = _verified_password_key(password, hashed)
+    if cache_key is not None:
+        with _verified_passwords_lock:
+            if cache_key in _verified_passwords:
+                _verified_passwords.move_to_end(cache_key)
+                return True
+
+    if not bcrypt.checkpw(password, hashed):
+        return False
 
+    if cache_key is not None:
+        with _verified_passwords_lock:
+            _verified_passwords[cache_key] = None
+            if len(_verified_passwords) > _VERIFIED_PASSWORDS_MAXSIZE:
+                _verified_passwords.popitem(last=False)
+    return True
+
+
+def forget_password_hash(hashed: bytes | str | None) -> None:
+    """Drop cached successful verifications against a password hash.
+
+    Args:
+        hashed: The hash being replaced (bytes or string)
+    """
+    if hashed is None:
+        return
+    if isinstance(hashed, str):
+        hashed = hashed.encode("utf-8")
+    with _verified_passwords_lock:
+        for key in [key for key in _verified_passwords if key[1] == hashed]:
+            del _verified_passwords[key]
+
+
+def _verified_password_key(password: bytes, hashed: bytes) -> tuple[bytes, bytes] | None:
+    """Build the verification cache key, peppered with the app's SECRET_KEY.
+
+    Raw passwords are never stored. Without an app context or a SECRET_KEY
+    there is no pepper, and verifications are not cached.
+    """
+    if not has_app_context():
+        return None
+    secret_key = current_app.config.get("SECRET_KEY")
+    if not secret_key:
+        return None
+    if isinstance(secret_key, str):
+        secret_key = secret_key.encode("utf-8")
+    return hmac.new(secret_key, password, hashlib.sha256).digest(), hashed
+
+
+@lru_cache(maxsize=1024)
 def convert_snake_to_camel(word: str) -> str:
     """Convert snake_case string to CamelCase.
 
@@ -68,12 +140,27 @@ def convert_snake_to_camel(word: str) -> str:
         'UserProfile'
         >>> convert_snake_to_camel("simple")
         'simple'
+
+    Results are memoized: callers pass model, endpoint and exception names,
+    a small set that is converted over and over while building the API.
     """
     if "_" not in word:
         return word
+    if (
+        word.isascii()
+        and word.islower()
+        and word.replace("_", "").isalpha()
+        and "__" not in word
+        and word[0] != "_"
+        and word[-1] != "_"
+    ):
+        # Plain lowercase words joined by single underscores: str.title() gives the same
+        # result in C. Digits, doubled or edge underscores etc. take the general path.
+        return word.replace("_", " ").title().replace(" ", "")
     return "".join(x.capitalize() or "_" for x in word.split("_"))
 
 
+@lru_cache(maxsize=1024)
 def convert_camel_to_snake(word: str) -> str:
     """Convert CamelCase string to snake_case.
 
@@ -88,6 +175,7 @@ def convert_camel_to_snake(word: str) -> str:
         'user_profile'
         >>> convert_camel_to_snake("APIKey")
         'api_key'
+
+    Results are memoized, like :func:`convert_snake_to_camel`.
     """
-    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", word)
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+    return _CAMEL_BOUNDARY_RE.sub("_", word).lower()
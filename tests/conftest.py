@@ -1,8 +1,15 @@
 """Test configuration and fixtures for flask-more-smorest tests."""
 
+import os
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
 from typing import TYPE_CHECKING
 
+# Cheap password hashes for tests; must be set before flask_more_smorest is imported
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
 import pytest
+import sqlalchemy as sa
 from flask import Flask
 from flask_smorest import Api
 from marshmallow import Schema
@@ -146,6 +153,38 @@ def runner(app: Flask) -> "FlaskCliRunner":
     return app.test_cli_runner()
 
 
+@pytest.fixture
+def count_queries() -> Callable[[], AbstractContextManager[list[str]]]:
+    """Record the SQL statements sent to ``db.engine`` inside a ``with`` block.
+
+    Must be entered within an application context.
+
+    Returns:
+        Factory for a context manager yielding the list of executed statements
+
+    Example:
+        >>> with count_queries() as statements:
+        ...     Model.get(model_id)
+        >>> assert statements == []
+    """
+
+    @contextmanager
+    def counter() -> Iterator[list[str]]:
+        statements: list[str] = []
+
+        def record_statement(*args: object) -> None:
+            statements.append(str(args[2]))
+
+        engine = db.engine
+        sa.event.listen(engine, "before_cursor_execute", record_statement)
+        try:
+            yield statements
+        finally:
+            sa.event.remove(engine, "before_cursor_execute", record_statement)
+
+    return counter
+
+
 # Globals that need to be available to modules
 globals()["User"] = None
 globals()["UserSchema"] = None
@@ -56,32 +56,31 @@ def api(app: Flask) -> Api:
     return Api(app, spec_kwargs=spec_kwargs)
 
 
+class CrudProduct(BaseModel):
+    """Product model shared by the CRUD tests; each test gets fresh tables in its own in-memory database."""
+
+    name = db.Column(db.String(100), nullable=False)
+    description = db.Column(db.String(500))
+    price = db.Column(db.Float, nullable=False)
+    in_stock = db.Column(db.Boolean, default=True)
+
+    def _can_read(self) -> bool:
+        return True
+
+    def _can_write(self) -> bool:
+        return True
+
+    def _can_create(self) -> bool:
+        return True
+
+
 @pytest.fixture(scope="function")
 def product_model(app: Flask) -> type[BaseModel]:
-    """Create a Product model for testing."""
-
-    rand_str = uuid.uuid4().hex
-    class_name = f"Product_{rand_str}"
-
-    ProductModel = type(
-        class_name,
-        (BaseModel,),
-        {
-            "__module__": __name__,
-            "name": db.Column(db.String(100), nullable=False),
-            "description": db.Column(db.String(500)),
-            "price": db.Column(db.Float, nullable=False),
-            "in_stock": db.Column(db.Boolean, default=True),
-            "_can_read": lambda self: True,
-            "_can_write": lambda self: True,
-            "_can_create": classmethod(lambda cls: True),
-        },
-    )
-
+    """Create the Product tables for testing."""
     with app.app_context():
         db.create_all()
 
-    return ProductModel
+    return CrudProduct
 
 
 @pytest.fixture(scope="function")
@@ -318,3 +317,29 @@ class TestCRUDIntegration:
             response = client.post("/api/products/", json=product_data)
             # Should return 422 for validation errors
             assert response.status_code == 422
+
+    def test_list_without_pagination_header(self, app: Flask, api: Api, product_model: type[BaseModel]) -> None:
+        """Test listing still paginates when the pagination header is disabled."""
+
+        class NoHeaderCRUDBlueprint(CRUDBlueprint):
+            PAGINATION_HEADER_NAME = None
+
+        blueprint = NoHeaderCRUDBlueprint(
+            "products_no_header",
+            __name__,
+            model=product_model,
+            url_prefix="/api/products-no-header/",
+        )
+        api.register_blueprint(blueprint)
+        client = app.test_client()
+
+        with app.app_context():
+            with product_model.bypass_perms():
+                for i in range(3):
+                    db.session.add(product_model(name=f"Product {i}", price=float(i)))
+                db.session.commit()
+
+            response = client.get("/api/products-no-header/?page_size=2")
+            assert response.status_code == 200
+            assert len(response.get_json()) == 2
+            assert "X-Pagination" not in response.headers
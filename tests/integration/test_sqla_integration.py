@@ -36,23 +36,11 @@ class Product(BaseModel):
 
 @pytest.fixture(scope="function")
 def test_model(app: Flask) -> type[Product]:
-    """Create a test model class."""
-
-    rand_str = uuid.uuid4().hex
-    class_name = f"Product_{rand_str}"
-
-    TestItem = type(
-        class_name,
-        (Product,),
-        {
-            "__module__": __name__,
-        },
-    )
-
+    """Create the test model tables."""
     with app.app_context():
         db.create_all()
 
-    return TestItem
+    return Product
 
 
 class TestBaseModelIntegration:
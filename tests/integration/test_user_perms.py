@@ -8,7 +8,8 @@ This test demonstrates:
 """
 
 import uuid
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager
 from typing import TYPE_CHECKING
 
 import pytest
@@ -25,13 +26,15 @@ from flask_more_smorest import (
     UserRole,
     UserSetting,
     db,
+    get_current_user,
     get_current_user_id,
     init_db,
     init_jwt,
 )
-from flask_more_smorest.error.exceptions import ForbiddenError
+from flask_more_smorest.error.exceptions import ForbiddenError, UnprocessableEntity
 from flask_more_smorest.perms.base_perms_model import BasePermsModel
 from flask_more_smorest.perms.model_mixins import UserOwnershipMixin
+from flask_more_smorest.utils import generate_password_hash
 
 if TYPE_CHECKING:
     from flask.testing import FlaskClient
@@ -271,6 +274,8 @@ class TestCustomUserExtension:
         # Test password methods
         assert user.is_password_correct("verified_password")
         assert not user.is_password_correct("wrong_password")
+        assert not user.is_password_correct("")
+        assert not user.is_password_correct("verified_password" + "x" * 72)
 
         # Test role methods
         assert user.has_role(DefaultUserRole.USER)
@@ -313,6 +318,58 @@ class TestCustomUserExtension:
             unverified_user.update(bio="Admin updated unverified bio")  # Should not raise
 
 
+class TestCurrentUser:
+    """Test per-request resolution of the authenticated user."""
+
+    def test_current_user_is_resolved_once_per_request(
+        self,
+        user_perms_app: Flask,
+        db_session: "scoped_session",
+        test_users: dict[str, uuid.UUID],
+        user_tokens: dict[str, str],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that the JWT is verified once per request and not shared across requests."""
+        from flask_more_smorest.perms import user_models
+
+        calls: list[int] = []
+        verify = user_models.verify_jwt_in_request
+
+        def counting_verify(*args: object, **kwargs: object) -> object:
+            calls.append(1)
+            return verify(*args, **kwargs)  # type: ignore[arg-type]
+
+        monkeypatch.setattr(user_models, "verify_jwt_in_request", counting_verify)
+
+        headers = {"Authorization": f"Bearer {user_tokens['verified']}"}
+        with user_perms_app.test_request_context(headers=headers):
+            user = get_current_user()
+            assert user is not None
+            assert user.id == test_users["verified_id"]
+            assert get_current_user() is user
+            assert get_current_user_id() == test_users["verified_id"]
+        assert len(calls) == 1
+
+        headers = {"Authorization": f"Bearer {user_tokens['admin']}"}
+        with user_perms_app.test_request_context(headers=headers):
+            assert get_current_user_id() == test_users["admin_id"]
+        assert len(calls) == 2
+
+    def test_anonymous_request_has_no_current_user(
+        self, user_perms_app: Flask, db_session: "scoped_session", caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that a request without (or with an invalid) JWT resolves to no user, quietly."""
+        with caplog.at_level("WARNING"):
+            with user_perms_app.test_request_context("/"):
+                assert get_current_user() is None
+                assert get_current_user_id() is None
+            with user_perms_app.test_request_context(headers={"Authorization": "Bearer not-a-jwt"}):
+                assert get_current_user() is None
+        assert caplog.records == []
+
+        assert get_current_user() is None
+
+
 class TestUserRelatedTables:
     """Test user-related default tables (settings, tokens, roles)."""
 
@@ -406,6 +463,31 @@ class TestUserRelatedTables:
         assert "API Token 1" in token_descriptions
         assert "API Token 2" in token_descriptions
 
+    def test_user_delete_removes_unloaded_settings_and_tokens(
+        self, db_session: "scoped_session", test_users: dict[str, uuid.UUID]
+    ) -> None:
+        """Test that deleting a user removes its settings and tokens when they are not loaded."""
+        user_id = test_users["verified_id"]
+        db_session.add_all(
+            [
+                UserSetting(user_id=user_id, key="theme", value="dark"),
+                Token(user_id=user_id, token="test_token", description="API Token"),
+            ]
+        )
+        db_session.commit()
+        db_session.expunge_all()
+
+        user = db_session.get(CustomUser, user_id)
+        assert user is not None
+        assert "settings" not in sa.inspect(user).dict
+        assert "tokens" not in sa.inspect(user).dict
+        with CustomUser.bypass_perms():
+            user.delete()
+
+        for model in (UserSetting, Token):
+            remaining = db_session.scalar(sa.select(sa.func.count()).select_from(model).where(model.user_id == user_id))
+            assert remaining == 0
+
     def test_user_roles(self, db_session: "scoped_session", test_users: dict[str, uuid.UUID]) -> None:
         """Test UserRole creation and retrieval."""
         admin_user = db_session.get(CustomUser, test_users["admin_id"])
@@ -423,6 +505,162 @@ class TestUserRelatedTables:
         assert regular_user.has_role(DefaultUserRole.USER)
         assert not regular_user.has_role(DefaultUserRole.ADMIN)
 
+    def test_role_checks_follow_role_changes(
+        self, db_session: "scoped_session", test_users: dict[str, uuid.UUID]
+    ) -> None:
+        """Test that memoized role lookups are refreshed when roles change."""
+        with CustomUser.bypass_perms(), UserRole.bypass_perms():
+            user = db_session.get(CustomUser, test_users["verified_id"])
+            assert user is not None
+            assert not user.is_admin
+            assert user.domain_ids == {test_users["domain_id"]}
+            assert not user.has_domain_access(uuid.uuid4())
+
+            admin_role = UserRole(role=DefaultUserRole.ADMIN, domain_id="*")
+            user.roles.append(admin_role)
+            assert user.is_admin
+            assert user.has_role(DefaultUserRole.ADMIN, domain_name="any_domain")
+            assert user.domain_ids == {test_users["domain_id"], "*"}
+            assert user.has_domain_access(uuid.uuid4())
+
+            admin_role.role = DefaultUserRole.SUPERADMIN
+            assert user.is_superadmin
+            assert not user.has_role(DefaultUserRole.ADMIN)
+
+            user.roles.remove(admin_role)
+            assert not user.is_admin
+            assert not user.has_domain_access(uuid.uuid4())
+
+            db_session.commit()
+            other_role = UserRole(user_id=user.id, role=DefaultUserRole.ADMIN, domain_id=test_users["domain_id"])
+            db_session.add(other_role)
+            db_session.commit()
+            assert user.has_role(DefaultUserRole.ADMIN, domain_name="test_domain")
+            assert not user.has_role(DefaultUserRole.ADMIN, domain_name="other_domain")
+
+    def test_default_domain_id_is_cached_per_request(
+        self,
+        user_perms_app: Flask,
+        db_session: "scoped_session",
+        test_users: dict[str, uuid.UUID],
+        count_queries: Callable[[], AbstractContextManager[list[str]]],
+    ) -> None:
+        """Test that the default domain lookup runs once per request until domains change."""
+        with user_perms_app.test_request_context():
+            with count_queries() as statements:
+                assert Domain.get_default_domain_id() == test_users["domain_id"]
+                assert Domain.get_default_domain_id() == test_users["domain_id"]
+            assert len(statements) == 1
+
+            db_session.delete(db_session.get(Domain, test_users["domain_id"]))
+            db_session.flush()
+            assert Domain.get_default_domain_id() is None
+
+    def test_password_change_requires_old_password(
+        self, db_session: "scoped_session", test_users: dict[str, uuid.UUID]
+    ) -> None:
+        """Test that changing a password checks old_password unless perms are bypassed."""
+        user = db_session.get(CustomUser, test_users["verified_id"])
+        assert user is not None
+
+        with pytest.raises(UnprocessableEntity):
+            user.update(password="new_password")
+        with pytest.raises(UnprocessableEntity):
+            user.update(password="new_password", old_password="wrong_password")
+
+        user.update(password="new_password", old_password="verified_password")
+        assert user.is_password_correct("new_password")
+
+        with CustomUser.bypass_perms():
+            user.update(password="reset_password")
+        assert user.is_password_correct("reset_password")
+
+    def test_password_longer_than_bcrypt_limit(
+        self, db_session: "scoped_session", test_users: dict[str, uuid.UUID]
+    ) -> None:
+        """Test that over-long passwords cannot be set but truncated legacy hashes still verify."""
+        long_password = "p" * 80
+        user = db_session.get(CustomUser, test_users["verified_id"])
+        assert user is not None
+
+        with pytest.raises(UnprocessableEntity):
+            user.set_password(long_password)
+        with pytest.raises(UnprocessableEntity):
+            user.update(password=long_password, old_password="verified_password")
+        with pytest.raises(UnprocessableEntity), CustomUser.bypass_perms():
+            CustomUser(email="long@example.com", password=long_password)
+        assert user.is_password_correct("verified_password")
+
+        # Hash as stored by bcrypt<5, which silently used the first 72 bytes
+        user.password = generate_password_hash(long_password[:72])
+        assert user.is_password_correct(long_password)
+        assert user.is_password_correct(long_password[:72])
+        assert not user.is_password_correct("q" * 80)
+
+    def test_has_role_without_loading_roles(
+        self, db_session: "scoped_session", test_users: dict[str, uuid.UUID]
+    ) -> None:
+        """Test that role checks on a user with unloaded roles do not load the collection."""
+        user = db_session.get(CustomUser, test_users["admin_id"])
+        assert user is not None
+        db_session.expire(user, ["roles"])
+
+        assert user.has_role(DefaultUserRole.ADMIN)
+        assert user.has_role(DefaultUserRole.ADMIN, domain_name="test_domain")
+        assert not user.has_role(DefaultUserRole.ADMIN, domain_name="other_domain")
+        assert not user.has_role(DefaultUserRole.SUPERADMIN)
+        assert "roles" not in sa.inspect(user).dict
+
+    def test_admin_flag_follows_roles_added_by_user_id(
+        self, db_session: "scoped_session", test_users: dict[str, uuid.UUID]
+    ) -> None:
+        """Test that memoized admin flags are dropped when a role is flushed for the user."""
+        with CustomUser.bypass_perms(), UserRole.bypass_perms():
+            user = db_session.get(CustomUser, test_users["verified_id"])
+            assert user is not None
+            db_session.expire(user, ["roles"])
+            assert not user.is_admin
+
+            db_session.add(UserRole(user_id=user.id, role=DefaultUserRole.ADMIN, domain_id="*"))
+            db_session.flush()
+            assert user.is_admin
+
+    def test_user_roles_loaded_without_n_plus_one(
+        self,
+        db_session: "scoped_session",
+        test_users: dict[str, uuid.UUID],
+        count_queries: Callable[[], AbstractContextManager[list[str]]],
+    ) -> None:
+        """Test that roles for a list of users are fetched in a single extra query."""
+        db_session.expunge_all()
+        with count_queries() as statements:
+            users = db_session.execute(sa.select(CustomUser)).scalars().all()
+            role_names = [[role.role for role in user.roles] for user in users]
+
+        assert len(users) == 3
+        assert sorted(len(names) for names in role_names) == [1, 1, 1]
+        assert len(statements) == 2
+
+    def test_with_perms_loaded(
+        self,
+        db_session: "scoped_session",
+        test_users: dict[str, uuid.UUID],
+        count_queries: Callable[[], AbstractContextManager[list[str]]],
+    ) -> None:
+        """Test that with_perms_loaded preloads roles and domains and blocks other lazy loads."""
+        db_session.expunge_all()
+        with count_queries() as statements:
+            users = db_session.execute(CustomUser.with_perms_loaded()).scalars().all()
+            admins = [user.email for user in users if user.is_admin]
+            domains = {role.domain.name for user in users for role in user.roles if role.domain}
+
+        assert admins == ["admin@example.com"]
+        assert domains == {"test_domain"}
+        assert len(statements) == 2
+
+        with pytest.raises(sa.exc.InvalidRequestError):
+            _ = users[0].settings
+
 
 class TestUserOwnershipMixin:
     """Test Note model with UserOwnershipMixin."""
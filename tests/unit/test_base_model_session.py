@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+
 import sqlalchemy as sa
 from flask import Flask
 from sqlalchemy.orm import Mapped, mapped_column
@@ -23,3 +26,14 @@ def test_base_model_allows_inactive_session(app: Flask) -> None:
         # Session is closed (inactive). New instances should still be creatable.
         other = SimpleModel(name="second")
         assert other.name == "second"
+
+
+def test_get_uses_identity_map(app: Flask, count_queries: Callable[[], AbstractContextManager[list[str]]]) -> None:
+    with app.app_context():
+        db.create_all()
+
+        instance = SimpleModel(name="cached").save()
+        instance_id = str(instance.id)  # refresh after commit
+        with count_queries() as statements:
+            assert SimpleModel.get(instance_id) is instance
+        assert statements == []
@@ -34,6 +34,9 @@ def test_check_create_handles_cycles_without_recursion_error(app: Flask) -> None
         # Create a self-cycle
         root.parent = root  # pyright: ignore[reportAttributeAccessIssue]
 
+    with app.test_request_context("/"):
         # Should not raise RecursionError due to cycle; any permission
         # exceptions would be raised explicitly instead.
-        root.check_create([root])
+        nested: list[object] = [root]
+        nested.append(nested)
+        root.check_create([root, nested])
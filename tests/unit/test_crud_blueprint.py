@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import pytest
+import sqlalchemy as sa
+from marshmallow import Schema, fields
 
 from flask_more_smorest import CRUDBlueprint, CRUDMethod
+from flask_more_smorest.crud.crud_blueprint import _partial_schema_instance, _url_converter_for_column
 
 
 def test_normalize_methods_from_list() -> None:
@@ -11,6 +14,16 @@ def test_normalize_methods_from_list() -> None:
     assert all(config == {} for config in normalized.values())
 
 
+def test_normalize_methods_from_list_returns_fresh_configs() -> None:
+    methods = ["GET", CRUDMethod.GET, CRUDMethod.POST]
+    first = CRUDBlueprint._normalize_methods(None, methods)  # type: ignore[arg-type]
+    assert list(first) == [CRUDMethod.GET, CRUDMethod.POST]
+
+    first[CRUDMethod.GET]["admin_only"] = True
+    second = CRUDBlueprint._normalize_methods(None, list(methods))  # type: ignore[arg-type]
+    assert second == {CRUDMethod.GET: {}, CRUDMethod.POST: {}}
+
+
 def test_normalize_methods_from_mapping() -> None:
     raw = {
         "GET": True,
@@ -27,3 +40,43 @@ def test_normalize_methods_rejects_invalid_values() -> None:
     raw = {"GET": 123}
     with pytest.raises(TypeError):
         CRUDBlueprint._normalize_methods(None, raw)  # type: ignore[arg-type]
+
+
+class _GuidType(sa.types.TypeDecorator[str]):
+    impl = sa.CHAR(32)
+    cache_ok = True
+
+
+@pytest.mark.parametrize(
+    ("column_type", "expected"),
+    [
+        (sa.Uuid(), "uuid"),
+        (sa.UUID(), "uuid"),
+        (sa.CHAR(32), "uuid"),
+        (_GuidType(), "uuid"),
+        (sa.Integer(), "int"),
+        (sa.BigInteger(), "int"),
+        (sa.Float(), "float"),
+        (sa.String(36), "string"),
+        (sa.Text(), "string"),
+        (sa.Boolean(), "string"),
+    ],
+)
+def test_url_converter_for_column(column_type: sa.types.TypeEngine[object], expected: str) -> None:
+    assert _url_converter_for_column(column_type) == expected
+
+
+def test_partial_schema_instance_is_cached_per_class() -> None:
+    class ParentSchema(Schema):
+        name = fields.String(required=True)
+
+    class ChildSchema(ParentSchema):
+        pass
+
+    parent = _partial_schema_instance(ParentSchema)
+    assert parent.partial is True
+    assert _partial_schema_instance(ParentSchema) is parent
+
+    child = _partial_schema_instance(ChildSchema)
+    assert isinstance(child, ChildSchema)
+    assert child is not parent
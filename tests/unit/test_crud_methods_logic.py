@@ -23,40 +23,6 @@ def test_methods_list_mode_whitelist(app: Flask) -> None:
         methods=[CRUDMethod.INDEX, CRUDMethod.GET],
     )
 
-    # Check that only INDEX and GET are enabled
-    assert (
-        CRUDMethod.INDEX
-        in bp._build_config(
-            "test_list",
-            __name__,
-            TestModelListMode,
-            TestModelListMode.Schema,
-            None,
-            None,
-            "id",
-            None,
-            [CRUDMethod.INDEX, CRUDMethod.GET],
-            None,
-            None,
-        ).methods
-    )
-    assert (
-        CRUDMethod.GET
-        in bp._build_config(
-            "test_list",
-            __name__,
-            TestModelListMode,
-            TestModelListMode.Schema,
-            None,
-            None,
-            "id",
-            None,
-            [CRUDMethod.INDEX, CRUDMethod.GET],
-            None,
-            None,
-        ).methods
-    )
-
     config = bp._build_config(
         "test_list",
         __name__,
@@ -71,6 +37,7 @@ def test_methods_list_mode_whitelist(app: Flask) -> None:
         None,
     )
 
+    # Check that only INDEX and GET are enabled
     assert len(config.methods) == 2
     assert CRUDMethod.INDEX in config.methods
     assert CRUDMethod.GET in config.methods
@@ -389,3 +356,19 @@ def test_empty_methods_dict(app: Flask) -> None:
 
     # Empty dict should enable all methods (dict mode behavior)
     assert len(config.methods) == len(CRUDMethod)
+
+
+def test_unknown_res_id_raises(app: Flask) -> None:
+    """Test that a res_id missing from the model is rejected at construction."""
+
+    class TestModelBadResId(BaseModel):
+        pass
+
+    with pytest.raises(ValueError, match="no 'slug' resource id field"):
+        CRUDBlueprint(
+            "test_bad_res_id",
+            __name__,
+            model=TestModelBadResId,
+            schema=TestModelBadResId.Schema,
+            res_id="slug",
+        )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import uuid
 from dataclasses import dataclass
 
@@ -7,7 +8,7 @@ import pytest
 from _pytest.monkeypatch import MonkeyPatch
 from flask import Flask
 
-from flask_more_smorest import BasePermsModel, db
+from flask_more_smorest import BasePermsModel, db, get_current_user, get_current_user_id, init_db
 from flask_more_smorest.error.exceptions import ForbiddenError
 
 
@@ -97,13 +98,79 @@ def test_can_write_uses_write_when_persisted(
     assert called == ["write"]
 
 
-def test_is_current_user_admin_handles_runtime_error(monkeypatch: MonkeyPatch) -> None:
+def test_is_current_user_admin_handles_runtime_error(
+    app: Flask, monkeypatch: MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    calls: list[int] = []
+
     def raise_runtime_error(*_args: object, **_kwargs: object) -> None:
+        calls.append(1)
         raise RuntimeError("no context")
 
     monkeypatch.setattr(
-        "flask_more_smorest.perms.base_perms_model.verify_jwt_in_request",
+        "flask_more_smorest.perms.user_models.verify_jwt_in_request",
         raise_runtime_error,
     )
 
+    with caplog.at_level(logging.DEBUG, logger="flask_more_smorest.perms.base_perms_model"):
+        with app.test_request_context("/"):
+            assert BasePermsModel.is_current_user_admin() is False
+    assert calls == [1]
+    assert "Runtime error during admin check" in caplog.text
+
+
+def test_is_current_user_admin_is_memoized_per_request(app: Flask, monkeypatch: MonkeyPatch) -> None:
+    calls: list[int] = []
+
+    def fake_check(cls: type[BasePermsModel]) -> bool:
+        calls.append(1)
+        return len(calls) == 1
+
+    monkeypatch.setattr(BasePermsModel, "_check_current_user_admin", classmethod(fake_check))
+
+    with app.app_context():
+        with app.test_request_context("/"):
+            assert BasePermsModel.is_current_user_admin() is True
+            assert BasePermsModel.is_current_user_admin() is True
+        assert len(calls) == 1
+
+        # A new request context must not reuse the previous request's result
+        with app.test_request_context("/"):
+            assert BasePermsModel.is_current_user_admin() is False
+        assert len(calls) == 2
+
+
+def test_bypass_perms_restores_previous_state(dummy_perms_model: type[BasePermsModel]) -> None:
+    assert dummy_perms_model.perms_disabled is False
+
+    with dummy_perms_model.bypass_perms():
+        assert dummy_perms_model.perms_disabled is True
+        with dummy_perms_model.bypass_perms():
+            assert dummy_perms_model.perms_disabled is True
+        assert dummy_perms_model.perms_disabled is True
+    assert dummy_perms_model.perms_disabled is False
+
+    with pytest.raises(RuntimeError):
+        with dummy_perms_model.bypass_perms():
+            raise RuntimeError("boom")
+    assert dummy_perms_model.perms_disabled is False
+
+
+def test_is_current_user_admin_is_false_outside_request(monkeypatch: MonkeyPatch) -> None:
+    def fail_check(cls: type[BasePermsModel]) -> bool:
+        raise AssertionError("admin check must not run outside a request")
+
+    monkeypatch.setattr(BasePermsModel, "_check_current_user_admin", classmethod(fail_check))
+
     assert BasePermsModel.is_current_user_admin() is False
+
+
+def test_current_user_is_anonymous_without_jwt_manager() -> None:
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
+    init_db(app)  # no init_jwt: JWT support is optional
+
+    with app.test_request_context("/", headers={"Authorization": "Bearer not-a-token"}):
+        assert get_current_user() is None
+        assert get_current_user_id() is None
+        assert BasePermsModel.is_current_user_admin() is False
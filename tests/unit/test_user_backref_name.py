@@ -1,5 +1,8 @@
 """Tests for HasUserMixin backref name configuration."""
 
+import uuid
+
+import sqlalchemy as sa
 from flask import Flask
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -60,3 +63,42 @@ def test_backref_with_custom_field_names(app: Flask) -> None:
     assert TestModelFields._user_backref_name() == "articles"
     assert TestModelFields._user_field_alias() == "author_id"
     assert TestModelFields._user_relationship_alias() == "author"
+
+
+def test_user_field_alias_reads_writes_and_queries(app: Flask) -> None:
+    """Test that field aliases proxy the user_id column on instances and in queries."""
+
+    class TestModelAlias(HasUserMixin, BaseModel):
+        __user_field_name__ = "owner_id"
+        __user_relationship_name__ = "owner"
+        __user_backref_name__ = ""
+        title: Mapped[str] = mapped_column(db.String(100))
+
+    owner_id = uuid.uuid4()
+    instance = TestModelAlias(title="aliased", owner_id=owner_id)
+    assert instance.user_id == owner_id
+    assert instance.owner_id == owner_id  # type: ignore[attr-defined]
+    assert instance.owner is None  # type: ignore[attr-defined]
+
+    other_id = uuid.uuid4()
+    instance.owner_id = other_id  # type: ignore[attr-defined]
+    assert instance.user_id == other_id
+
+    clause = str(sa.select(TestModelAlias).filter_by(owner_id=other_id))
+    assert "user_id" in clause
+
+
+def test_user_relationship_and_backref_lazy(app: Flask) -> None:
+    """Test loader strategy defaults and the backref lazy knob."""
+
+    class TestModelLazy(HasUserMixin, BaseModel):
+        __user_backref_name__ = "lazy_items"
+        __user_backref_lazy__ = "selectin"
+        title: Mapped[str] = mapped_column(db.String(100))
+
+    sa.orm.configure_mappers()
+
+    from flask_more_smorest.perms.user_models import User
+
+    assert sa.inspect(TestModelLazy).relationships["user"].lazy == "selectin"
+    assert sa.inspect(User).relationships["lazy_items"].lazy == "selectin"
@@ -1,6 +1,16 @@
 """Unit tests for utility functions."""
 
-from flask_more_smorest.utils import convert_snake_to_camel
+import pytest
+from flask import Flask
+
+from flask_more_smorest import utils
+from flask_more_smorest.utils import (
+    check_password_hash,
+    convert_camel_to_snake,
+    convert_snake_to_camel,
+    forget_password_hash,
+    generate_password_hash,
+)
 
 
 class TestConvertSnakeToCamel:
@@ -50,3 +60,64 @@ class TestConvertSnakeToCamel:
         """Test conversion of all caps strings."""
         assert convert_snake_to_camel("USER") == "USER"
         assert convert_snake_to_camel("USER_PROFILE") == "UserProfile"
+
+
+class TestCheckPasswordHash:
+    """Tests for check_password_hash and its verification cache."""
+
+    def test_successful_verification_is_cached(self, app: Flask, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that repeat verifications of a correct password skip bcrypt."""
+        app.config["SECRET_KEY"] = "test-secret"
+        hashed = generate_password_hash("password123")
+        calls: list[bytes] = []
+        checkpw = utils.bcrypt.checkpw
+
+        def counting_checkpw(password: bytes, hashed_password: bytes) -> bool:
+            calls.append(password)
+            return checkpw(password, hashed_password)
+
+        monkeypatch.setattr(utils.bcrypt, "checkpw", counting_checkpw)
+        with app.app_context():
+            assert check_password_hash("password123", hashed)
+            assert check_password_hash("password123", hashed)
+            assert not check_password_hash("wrong", hashed)
+            assert not check_password_hash("wrong", hashed)
+            assert len(calls) == 3
+
+            forget_password_hash(hashed)
+            assert check_password_hash("password123", hashed)
+            assert len(calls) == 4
+
+    def test_no_cache_outside_app_context(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that verifications outside an app context always run bcrypt."""
+        hashed = generate_password_hash("password123")
+        calls: list[bytes] = []
+        checkpw = utils.bcrypt.checkpw
+
+        def counting_checkpw(password: bytes, hashed_password: bytes) -> bool:
+            calls.append(password)
+            return checkpw(password, hashed_password)
+
+        monkeypatch.setattr(utils.bcrypt, "checkpw", counting_checkpw)
+        assert check_password_hash("password123", hashed)
+        assert check_password_hash("password123", hashed)
+        assert len(calls) == 2
+
+
+@pytest.mark.parametrize(
+    ("word", "expected"),
+    [
+        ("UserProfile", "user_profile"),
+        ("APIKey", "api_key"),
+        ("HTTPResponseCode", "http_response_code"),
+        ("aBcDe", "a_bc_de"),
+        ("user_Profile", "user__profile"),
+        ("Version2Update", "version2_update"),
+        ("already_snake", "already_snake"),
+        ("ABC", "abc"),
+        ("", ""),
+    ],
+)
+def test_convert_camel_to_snake(word: str, expected: str) -> None:
+    """Test CamelCase to snake_case conversion, including edge cases."""
+    assert convert_camel_to_snake(word) == expected